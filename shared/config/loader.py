@@ -5,14 +5,26 @@ This module provides a unified configuration system that works with
 the same YAML schema as the Go backup tool.
 """
 
+import copy
 import os
 import yaml
 import json
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Union
 from dataclasses import dataclass, field
 from datetime import timedelta
 
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+
+# Parsed YAML documents keyed on absolute path, validated against the file's
+# (st_mtime_ns, st_size) so an edited file is re-read on the next load.
+_YAML_CACHE: "OrderedDict[str, tuple]" = OrderedDict()
+_YAML_CACHE_SIZE = 100
+
 
 @dataclass
 class ConnectionConfig:
@@ -494,8 +506,7 @@ class ConfigLoader:
             return config
         
         try:
-            with open(path_obj, 'r') as f:
-                data = yaml.safe_load(f)
+            data = self._read_file(path_obj)
             
             if data:
                 # Merge configurations (simplified version)
@@ -505,6 +516,32 @@ class ConfigLoader:
         
         return config
     
+    @staticmethod
+    def _read_file(path_obj: Path) -> Any:
+        """Parse a YAML file, reusing the cached document while it is unchanged.
+        
+        Args:
+            path_obj: Path to the YAML file
+            
+        Returns:
+            Any: A private copy of the parsed document
+        """
+        key = os.path.abspath(path_obj)
+        st = os.stat(key)
+        entry = _YAML_CACHE.get(key)
+        if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            _YAML_CACHE.move_to_end(key)
+            return copy.deepcopy(entry[2])
+        
+        with open(key, 'r') as f:
+            data = yaml.load(f, Loader=_SafeLoader)
+        
+        _YAML_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+        _YAML_CACHE.move_to_end(key)
+        if len(_YAML_CACHE) > _YAML_CACHE_SIZE:
+            _YAML_CACHE.popitem(last=False)
+        return copy.deepcopy(data)
+    
     def _merge_configs(self, config: SharedConfig, data: Dict[str, Any]) -> SharedConfig:
         """Merge configuration data into existing config.
         
@@ -711,7 +748,7 @@ class ConfigLoader:
         config_dict = self._config_to_dict(config)
         
         with open(path_obj, 'w') as f:
-            yaml.dump(config_dict, f, default_flow_style=False)
+            yaml.dump(config_dict, f, Dumper=_SafeDumper, default_flow_style=False)
     
     def _config_to_dict(self, config: SharedConfig) -> Dict[str, Any]:
         """Convert configuration to dictionary.
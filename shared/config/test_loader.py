@@ -320,6 +320,25 @@ class TestConfigLoader:
         finally:
             os.unlink(save_path)
     
+    def test_cached_file_reloaded_after_change(self):
+        """Test that an edited file is re-parsed instead of served from cache."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            yaml.dump({'cluster': {'name': 'first'}}, f)
+            config_path = f.name
+        
+        try:
+            loader = ConfigLoader([config_path])
+            assert loader.load_without_validation().cluster.name == 'first'
+            assert loader.load_without_validation().cluster.name == 'first'
+            
+            with open(config_path, 'w') as f:
+                yaml.dump({'cluster': {'name': 'second-cluster'}}, f)
+            
+            assert loader.load_without_validation().cluster.name == 'second-cluster'
+            
+        finally:
+            os.unlink(config_path)
+    
     def test_default_config_paths(self):
         """Test default configuration paths."""
         loader = ConfigLoader()
@@ -417,6 +436,7 @@ if __name__ == '__main__':
     runner.run_test(test_loader.test_validation_errors)
     runner.run_test(test_loader.test_valid_configuration)
     runner.run_test(test_loader.test_save_configuration)
+    runner.run_test(test_loader.test_cached_file_reloaded_after_change)
     runner.run_test(test_loader.test_default_config_paths)
     runner.run_test(test_loader.test_environment_variable_expansion)
     runner.run_test(test_gitops.test_get_gitops_config_from_shared)
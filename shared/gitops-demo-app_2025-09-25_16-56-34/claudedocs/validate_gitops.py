@@ -3,12 +3,88 @@
 GitOps Structure Integrity Validation Script
 Validates Kustomization builds, ArgoCD applications, and Flux manifests
 """
+import argparse
+import io
+import mmap
 import os
 import json
+import shutil
 import subprocess
+import tempfile
+import threading
 import yaml
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Set
+from typing import List, Dict, Any, Optional, Set
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+try:
+    import orjson
+except ImportError:  # optional accelerator, stdlib json is used otherwise
+    orjson = None
+
+# Directories never descended into while scanning for manifests
+DEFAULT_SKIP_DIRS = frozenset({'.git', 'node_modules', '.terraform', 'vendor'})
+KUSTOMIZATION_FILENAMES = frozenset({'kustomization.yaml', 'kustomization.yml'})
+
+# Report rules
+_EQ80 = "=" * 80
+_DASH40 = "-" * 40
+
+
+ARGOCD_MARKERS = (b'argoproj.io', b'Application')
+FLUX_MARKERS = (b'fluxcd.io',)
+RELEVANT_API_GROUPS = ('argoproj.io', 'fluxcd.io')
+FLUX_KINDS = frozenset({'GitRepository', 'Kustomization', 'HelmRepository', 'HelmRelease'})
+
+
+def _find_markers(path: str, needles: tuple) -> Set[bytes]:
+    """Cheap byte-level scan returning which needles occur in a file, before parsing it"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return set()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            return {needle for needle in needles if m.find(needle) != -1}
+
+
+# Parsed documents keyed by (path, mtime_ns, size), evicted least recently used first
+_DOC_CACHE_SIZE = 512
+_doc_cache: 'OrderedDict[tuple, list]' = OrderedDict()
+_doc_cache_lock = threading.Lock()
+
+
+def _load_docs(path: str) -> list:
+    """Parse every document in a YAML file, reusing the result while the file is unchanged
+    
+    Callers must treat the returned documents as read-only.
+    """
+    st = os.stat(path)
+    key = (os.fspath(path), st.st_mtime_ns, st.st_size)
+    with _doc_cache_lock:
+        docs = _doc_cache.get(key)
+        if docs is not None:
+            _doc_cache.move_to_end(key)
+            return docs
+    
+    with open(path, 'rb') as f:
+        docs = list(yaml.load_all(f, Loader=_SafeLoader))
+    
+    with _doc_cache_lock:
+        _doc_cache[key] = docs
+        while len(_doc_cache) > _DOC_CACHE_SIZE:
+            _doc_cache.popitem(last=False)
+    return docs
+
+
+def clear_doc_cache():
+    """Drop all memoized YAML documents"""
+    with _doc_cache_lock:
+        _doc_cache.clear()
 
 class GitOpsValidator:
     def __init__(self, project_root: str):
@@ -24,12 +100,28 @@ class GitOpsValidator:
             'errors': [],
             'warnings': []
         }
+        self._scanned = False
+        self._kustomization_paths: List[Path] = []
+        self._yaml_paths: List[str] = []
+        self._top_entries: Dict[str, bool] = {}
+        self._overlays: List[str] = []
+        self._classified = False
+        self._argocd_apps: List[Dict[str, Any]] = []
+        self._flux_manifests: List[Dict[str, Any]] = []
+        self._rel_cache: Dict[str, str] = {}
+        self._dir_cache: Dict[str, frozenset] = {}
         self.check_tools()
     
     def check_tools(self):
         """Check if required tools are available"""
+        if _SafeLoader is yaml.SafeLoader:
+            print("⚠️  libyaml not available - YAML parsing will use the slower pure-Python loader")
+        
+        # An absolute executable path and close_fds=False keep subprocess on its
+        # posix_spawn fast path instead of fork+exec; our own fds are non-inheritable
+        self._kustomize = shutil.which('kustomize') or 'kustomize'
         try:
-            result = subprocess.run(['kustomize', 'version'], 
+            result = subprocess.run([self._kustomize, 'version'], close_fds=False,
                                   capture_output=True, text=True, timeout=10)
             self.results['kustomize_available'] = result.returncode == 0
             if self.results['kustomize_available']:
@@ -39,28 +131,116 @@ class GitOpsValidator:
         except Exception:
             print("❌ kustomize not available - build tests will be skipped")
             self.results['kustomize_available'] = False
+        
+        # fd is much faster than os.walk on very large trees; rg is not used because
+        # it cannot list symlinked files without also following symlinked directories
+        self._file_lister = shutil.which('fd') or shutil.which('fdfind')
+    
+    def _list_yaml_with_tool(self) -> Optional[List[str]]:
+        """List YAML files via fd, or None if fd is not available or it fails"""
+        if not self._file_lister:
+            return None
+        
+        # Same file set as _walk_yaml_files: regular files and symlinks, hidden and
+        # ignored paths included, case-sensitive extension match, same pruned dirs
+        cmd = [self._file_lister, '--type', 'f', '--type', 'l', '--hidden', '--no-ignore',
+               '--case-sensitive', '--regex', r'\.ya?ml$']
+        for skip in sorted(DEFAULT_SKIP_DIRS):
+            cmd.extend(['--exclude', skip])
+        
+        try:
+            # Run from the project root so listed paths are relative to it
+            process = subprocess.run(cmd, cwd=self.project_root, capture_output=True,
+                                     text=True, timeout=120)
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+        # Any error (e.g. an unreadable directory) falls back to os.walk
+        if process.returncode != 0:
+            return None
+        
+        root = os.fspath(self.project_root)
+        yaml_files = []
+        for line in process.stdout.splitlines():
+            if not line:
+                continue
+            full_path = os.path.join(root, line[2:] if line.startswith('./') else line)
+            # os.walk reports symlinks to directories as directories, not files
+            if not os.path.isdir(full_path):
+                yaml_files.append(full_path)
+        return yaml_files
+    
+    def _walk_yaml_files(self) -> List[str]:
+        """List YAML files with os.walk, pruning skipped directories"""
+        yaml_files = []
+        for dirpath, dirnames, filenames in os.walk(self.project_root, topdown=True):
+            # Prune in place so excluded subtrees are never listed
+            dirnames[:] = [d for d in dirnames if d not in DEFAULT_SKIP_DIRS]
+            
+            for name in filenames:
+                if name.endswith(('.yaml', '.yml')):
+                    yaml_files.append(os.path.join(dirpath, name))
+        return yaml_files
+    
+    def _scan_repo(self):
+        """List the project's YAML files once and bucket kustomization files"""
+        if self._scanned:
+            return
+        
+        yaml_files = self._list_yaml_with_tool()
+        if yaml_files is None:
+            yaml_files = self._walk_yaml_files()
+        
+        # Plain strings until a file survives classification
+        for full_path in yaml_files:
+            self._yaml_paths.append(full_path)
+            if os.path.basename(full_path) in KUSTOMIZATION_FILENAMES:
+                self._kustomization_paths.append(Path(full_path))
+        
+        self._yaml_paths.sort()
+        self._kustomization_paths.sort()
+        
+        # One listing of the project root (and overlays/) answers the directory layout checks
+        with os.scandir(self.project_root) as entries:
+            self._top_entries = {e.name: e.is_dir() for e in entries}
+        if self._top_entries.get('overlays'):
+            with os.scandir(self.project_root / 'overlays') as entries:
+                self._overlays = [e.name for e in entries if e.is_dir()]
+        
+        self._scanned = True
+    
+    def _dir_entries(self, dir_path: str) -> frozenset:
+        """Names in a directory, listed once per validator; empty if it cannot be listed"""
+        entries = self._dir_cache.get(dir_path)
+        if entries is None:
+            try:
+                entries = frozenset(os.listdir(dir_path))
+            except OSError:
+                entries = frozenset()
+            self._dir_cache[dir_path] = entries
+        return entries
+    
+    def _path_exists(self, base_dir: Path, reference: str) -> bool:
+        """Answer an existence check from the cached listing of the parent directory"""
+        parent, name = os.path.split(os.path.normpath(os.path.join(base_dir, reference)))
+        return name in self._dir_entries(parent)
+    
+    def _rel(self, path: Path) -> str:
+        """Project-relative path string, computed once per path"""
+        key = os.fspath(path)
+        rel = self._rel_cache.get(key)
+        if rel is None:
+            rel = self._rel_cache[key] = str(Path(path).relative_to(self.project_root))
+        return rel
     
     def find_kustomization_files(self) -> List[Path]:
         """Find all kustomization files"""
-        kustomization_files = []
-        
-        # Look for kustomization.yaml and kustomization.yml files
-        for pattern in ['**/kustomization.yaml', '**/kustomization.yml']:
-            kustomization_files.extend(self.project_root.glob(pattern))
-        
-        # Filter out files in excluded directories
-        exclude_dirs = ['node_modules', '.git']
-        filtered_files = []
-        for file_path in kustomization_files:
-            if not any(exclude_dir in str(file_path) for exclude_dir in exclude_dirs):
-                filtered_files.append(file_path)
-        
-        return sorted(filtered_files)
+        self._scan_repo()
+        return list(self._kustomization_paths)
     
     def validate_kustomization_file(self, file_path: Path) -> Dict[str, Any]:
         """Validate individual kustomization file"""
         result = {
-            'file': str(file_path.relative_to(self.project_root)),
+            'file': self._rel(file_path),
             'valid': False,
             'errors': [],
             'warnings': [],
@@ -73,8 +253,10 @@ class GitOpsValidator:
         }
         
         try:
-            with open(file_path, 'r') as f:
-                kustomization = yaml.safe_load(f)
+            docs = _load_docs(file_path)
+            if len(docs) > 1:
+                raise ValueError('expected a single document in the stream')
+            kustomization = docs[0] if docs else None
             
             if not kustomization:
                 result['errors'].append('Empty kustomization file')
@@ -88,8 +270,7 @@ class GitOpsValidator:
             result['resources'] = resources
             
             for resource in resources:
-                resource_path = base_dir / resource
-                if not resource_path.exists():
+                if not self._path_exists(base_dir, resource):
                     result['missing_resources'].append(resource)
                     result['warnings'].append(f'Missing resource: {resource}')
             
@@ -107,13 +288,11 @@ class GitOpsValidator:
             
             for patch in all_patches:
                 if isinstance(patch, str):
-                    patch_path = base_dir / patch
-                    if not patch_path.exists():
+                    if not self._path_exists(base_dir, patch):
                         result['missing_patches'].append(patch)
                         result['warnings'].append(f'Missing patch file: {patch}')
                 elif isinstance(patch, dict) and 'path' in patch:
-                    patch_path = base_dir / patch['path']
-                    if not patch_path.exists():
+                    if not self._path_exists(base_dir, patch['path']):
                         result['missing_patches'].append(patch['path'])
                         result['warnings'].append(f'Missing patch file: {patch["path"]}')
             
@@ -125,11 +304,10 @@ class GitOpsValidator:
                 result['warnings'].append('Using deprecated "bases" field, consider using "resources"')
             
             for base in bases:
-                base_path = base_dir / base
-                if not base_path.exists():
+                if not self._path_exists(base_dir, base):
                     result['missing_bases'].append(base)
                     result['warnings'].append(f'Missing base: {base}')
-                elif not (base_path / 'kustomization.yaml').exists() and not (base_path / 'kustomization.yml').exists():
+                elif KUSTOMIZATION_FILENAMES.isdisjoint(self._dir_entries(os.path.normpath(base_dir / base))):
                     result['warnings'].append(f'Base directory missing kustomization file: {base}')
             
             # Check for common configuration issues
@@ -162,12 +340,11 @@ class GitOpsValidator:
     def test_kustomize_build(self, kustomization_dir: Path) -> Dict[str, Any]:
         """Test kustomize build for a directory"""
         result = {
-            'directory': str(kustomization_dir.relative_to(self.project_root)),
+            'directory': self._rel(kustomization_dir),
             'build_successful': False,
-            'output': '',
             'errors': [],
             'manifest_count': 0,
-            'resource_types': set()
+            'resource_types': []
         }
         
         if not self.results['kustomize_available']:
@@ -175,28 +352,51 @@ class GitOpsValidator:
             return result
         
         try:
-            cmd = ['kustomize', 'build', str(kustomization_dir)]
-            process = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            cmd = [self._kustomize, 'build', str(kustomization_dir)]
+            timed_out = threading.Event()
+            parse_error = None
+            kinds = {}  # insertion-ordered set of kinds, first seen first
+            manifest_count = 0
             
-            result['output'] = process.stdout
-            result['build_successful'] = process.returncode == 0
-            
-            if not result['build_successful']:
-                result['errors'].append(f'Build failed: {process.stderr}')
-            else:
-                # Parse the output to count manifests and resource types
-                try:
-                    manifests = list(yaml.safe_load_all(result['output']))
-                    valid_manifests = [m for m in manifests if m is not None]
-                    result['manifest_count'] = len(valid_manifests)
-                    
-                    for manifest in valid_manifests:
-                        if isinstance(manifest, dict) and 'kind' in manifest:
-                            result['resource_types'].add(manifest['kind'])
-                    
-                    result['resource_types'] = list(result['resource_types'])
-                except Exception as e:
-                    result['errors'].append(f'Error parsing build output: {str(e)}')
+            # stderr goes to a temp file so a chatty build cannot block on a full pipe
+            # while stdout is being parsed
+            with tempfile.TemporaryFile() as stderr_file:
+                with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file,
+                                      close_fds=False) as process:
+                    timer = threading.Timer(60, lambda: (timed_out.set(), process.kill()))
+                    timer.start()
+                    try:
+                        # Parse the output as it streams in to count manifests and resource types
+                        try:
+                            for manifest in yaml.load_all(process.stdout, Loader=_SafeLoader):
+                                if manifest is None:
+                                    continue
+                                manifest_count += 1
+                                if isinstance(manifest, dict) and 'kind' in manifest:
+                                    kinds[manifest['kind']] = None
+                        except yaml.YAMLError as e:
+                            parse_error = e
+                            # Drain the rest so kustomize can exit
+                            while process.stdout.read(65536):
+                                pass
+                        returncode = process.wait()
+                    finally:
+                        timer.cancel()
+                
+                if timed_out.is_set():
+                    raise subprocess.TimeoutExpired(cmd, 60)
+                
+                result['build_successful'] = returncode == 0
+                if not result['build_successful']:
+                    stderr_file.seek(0)
+                    stderr = stderr_file.read().decode('utf-8', errors='replace')
+                    result['errors'].append(f'Build failed: {stderr}')
+                elif parse_error is not None:
+                    result['errors'].append(f'Error parsing build output: {str(parse_error)}')
+                else:
+                    # Counts are only reported for a build whose whole output parsed
+                    result['manifest_count'] = manifest_count
+                    result['resource_types'] = list(kinds)
             
         except subprocess.TimeoutExpired:
             result['errors'].append('Build timed out')
@@ -205,37 +405,48 @@ class GitOpsValidator:
         
         return result
     
-    def validate_argocd_applications(self) -> List[Dict[str, Any]]:
-        """Validate ArgoCD application manifests"""
-        argocd_apps = []
-        
-        # Find ArgoCD application files
-        yaml_files = list(self.project_root.glob('**/*.yaml'))
-        yaml_files.extend(list(self.project_root.glob('**/*.yml')))
+    def _classify_and_dispatch(self):
+        """Parse candidate YAML files once, routing ArgoCD and Flux documents to their validators"""
+        if self._classified:
+            return
+        self._scan_repo()
         
-        for file_path in yaml_files:
+        for file_path in self._yaml_paths:
             try:
-                with open(file_path, 'r') as f:
-                    content = f.read()
+                markers = _find_markers(file_path, ARGOCD_MARKERS + FLUX_MARKERS)
+                maybe_argocd = markers.issuperset(ARGOCD_MARKERS)
+                maybe_flux = markers.issuperset(FLUX_MARKERS)
+                if not (maybe_argocd or maybe_flux):
+                    continue
+                
+                for doc in _load_docs(file_path):
+                    if not (doc and isinstance(doc, dict)):
+                        continue
+                    # Cheapest rejection first: most documents belong to neither API group
+                    api_version = doc.get('apiVersion')
+                    if not isinstance(api_version, str) or not any(g in api_version for g in RELEVANT_API_GROUPS):
+                        continue
+                    kind = doc.get('kind')
+                    
+                    if maybe_argocd and kind == 'Application' and 'argoproj.io' in api_version:
+                        self._argocd_apps.append(self.validate_argocd_application(Path(file_path), doc))
+                    elif maybe_flux and kind in FLUX_KINDS and 'fluxcd.io' in api_version:
+                        self._flux_manifests.append(self.validate_flux_manifest(Path(file_path), doc))
                 
-                docs = list(yaml.safe_load_all(content))
-                for doc in docs:
-                    if (doc and isinstance(doc, dict) and 
-                        doc.get('kind') == 'Application' and 
-                        'argoproj.io' in doc.get('apiVersion', '')):
-                        
-                        app_result = self.validate_argocd_application(file_path, doc)
-                        argocd_apps.append(app_result)
-                        
             except Exception as e:
                 self.results['warnings'].append(f'Error reading {file_path}: {str(e)}')
         
-        return argocd_apps
+        self._classified = True
+    
+    def validate_argocd_applications(self) -> List[Dict[str, Any]]:
+        """Validate ArgoCD application manifests"""
+        self._classify_and_dispatch()
+        return self._argocd_apps
     
     def validate_argocd_application(self, file_path: Path, app_manifest: dict) -> Dict[str, Any]:
         """Validate individual ArgoCD application"""
         result = {
-            'file': str(file_path.relative_to(self.project_root)),
+            'file': self._rel(file_path),
             'name': app_manifest.get('metadata', {}).get('name', 'unknown'),
             'valid': True,
             'errors': [],
@@ -285,37 +496,13 @@ class GitOpsValidator:
     
     def validate_flux_manifests(self) -> List[Dict[str, Any]]:
         """Validate Flux v2 manifests"""
-        flux_manifests = []
-        
-        # Find Flux manifest files
-        yaml_files = list(self.project_root.glob('**/*.yaml'))
-        yaml_files.extend(list(self.project_root.glob('**/*.yml')))
-        
-        flux_kinds = ['GitRepository', 'Kustomization', 'HelmRepository', 'HelmRelease']
-        
-        for file_path in yaml_files:
-            try:
-                with open(file_path, 'r') as f:
-                    content = f.read()
-                
-                docs = list(yaml.safe_load_all(content))
-                for doc in docs:
-                    if (doc and isinstance(doc, dict) and 
-                        doc.get('kind') in flux_kinds and 
-                        'fluxcd.io' in doc.get('apiVersion', '')):
-                        
-                        flux_result = self.validate_flux_manifest(file_path, doc)
-                        flux_manifests.append(flux_result)
-                        
-            except Exception as e:
-                self.results['warnings'].append(f'Error reading {file_path}: {str(e)}')
-        
-        return flux_manifests
+        self._classify_and_dispatch()
+        return self._flux_manifests
     
     def validate_flux_manifest(self, file_path: Path, manifest: dict) -> Dict[str, Any]:
         """Validate individual Flux manifest"""
         result = {
-            'file': str(file_path.relative_to(self.project_root)),
+            'file': self._rel(file_path),
             'kind': manifest.get('kind'),
             'name': manifest.get('metadata', {}).get('name', 'unknown'),
             'valid': True,
@@ -366,26 +553,13 @@ class GitOpsValidator:
             'recommendations': []
         }
         
-        # Check for base directory
-        base_dir = self.project_root / 'base'
-        structure['has_base_directory'] = base_dir.exists() and base_dir.is_dir()
-        
-        # Check for overlays directory
-        overlays_dir = self.project_root / 'overlays'
-        structure['has_overlays_directory'] = overlays_dir.exists() and overlays_dir.is_dir()
-        
-        if structure['has_overlays_directory']:
-            for item in overlays_dir.iterdir():
-                if item.is_dir():
-                    structure['overlay_environments'].append(item.name)
-        
-        # Check for ArgoCD directory
-        argocd_dir = self.project_root / 'argocd'
-        structure['argocd_directory'] = argocd_dir.exists() and argocd_dir.is_dir()
-        
-        # Check for Flux directory
-        flux_dir = self.project_root / 'flux'
-        structure['flux_directory'] = flux_dir.exists() and flux_dir.is_dir()
+        # Top-level layout comes from the listing captured during the repo scan
+        self._scan_repo()
+        structure['has_base_directory'] = self._top_entries.get('base', False)
+        structure['has_overlays_directory'] = self._top_entries.get('overlays', False)
+        structure['overlay_environments'] = list(self._overlays)
+        structure['argocd_directory'] = self._top_entries.get('argocd', False)
+        structure['flux_directory'] = self._top_entries.get('flux', False)
         
         # Generate recommendations
         if not structure['has_base_directory']:
@@ -410,28 +584,39 @@ class GitOpsValidator:
         
         # Find and validate kustomization files
         kustomization_files = self.find_kustomization_files()
-        self.results['kustomization_files'] = [str(f.relative_to(self.project_root)) for f in kustomization_files]
+        self.results['kustomization_files'] = [self._rel(f) for f in kustomization_files]
         
         print(f"Found {len(kustomization_files)} kustomization files")
         
-        for kustomization_file in kustomization_files:
-            print(f"Validating kustomization: {kustomization_file.relative_to(self.project_root)}")
-            
-            # Validate kustomization file
-            validation_result = self.validate_kustomization_file(kustomization_file)
-            file_key = str(kustomization_file.relative_to(self.project_root))
-            self.results['resource_references'][file_key] = validation_result
+        # Validate kustomization files on a thread pool; libyaml parsing and
+        # filesystem checks release the GIL. Results are merged in file order.
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4)) as executor:
+            validations = []
+            for kustomization_file in kustomization_files:
+                file_key = self._rel(kustomization_file)
+                print(f"Validating kustomization: {file_key}")
+                validations.append((file_key, executor.submit(self.validate_kustomization_file, kustomization_file)))
             
-            # Test kustomize build
-            if self.results['kustomize_available']:
-                build_result = self.test_kustomize_build(kustomization_file.parent)
-                self.results['kustomize_build_results'][file_key] = build_result
-                
-                if not build_result['build_successful']:
-                    self.results['errors'].extend([
-                        f"{build_result['directory']}: {error}" 
-                        for error in build_result['errors']
-                    ])
+            for file_key, future in validations:
+                self.results['resource_references'][file_key] = future.result()
+        
+        # Test kustomize builds concurrently; each build is a separate process,
+        # so threads only wait on it. Results are merged in file order.
+        if self.results['kustomize_available'] and kustomization_files:
+            with ThreadPoolExecutor(max_workers=min(len(kustomization_files), os.cpu_count() or 4)) as executor:
+                builds = [
+                    (self._rel(f), executor.submit(self.test_kustomize_build, f.parent))
+                    for f in kustomization_files
+                ]
+                for file_key, future in builds:
+                    build_result = future.result()
+                    self.results['kustomize_build_results'][file_key] = build_result
+                    
+                    if not build_result['build_successful']:
+                        self.results['errors'].extend([
+                            f"{build_result['directory']}: {error}" 
+                            for error in build_result['errors']
+                        ])
         
         # Validate ArgoCD applications
         print("Validating ArgoCD applications...")
@@ -449,124 +634,148 @@ class GitOpsValidator:
     
     def generate_report(self) -> str:
         """Generate comprehensive GitOps validation report"""
-        report = []
-        report.append("=" * 80)
-        report.append("GITOPS STRUCTURE INTEGRITY VALIDATION REPORT")
-        report.append("=" * 80)
+        buf = io.StringIO()
+        w = buf.write
+        
+        def line(text: str = '') -> None:
+            w(text)
+            w('\n')
+        
+        line(_EQ80)
+        line("GITOPS STRUCTURE INTEGRITY VALIDATION REPORT")
+        line(_EQ80)
         
         # Tool availability
-        report.append(f"kustomize available: {'Yes' if self.results['kustomize_available'] else 'No'}")
-        report.append("")
+        line(f"kustomize available: {'Yes' if self.results['kustomize_available'] else 'No'}")
+        line("")
         
         # Directory structure analysis
         structure = self.results['directory_structure']
-        report.append("DIRECTORY STRUCTURE ANALYSIS:")
-        report.append("-" * 40)
-        report.append(f"Base directory: {'✅ Present' if structure['has_base_directory'] else '❌ Missing'}")
-        report.append(f"Overlays directory: {'✅ Present' if structure['has_overlays_directory'] else '❌ Missing'}")
-        report.append(f"ArgoCD directory: {'✅ Present' if structure['argocd_directory'] else '❌ Missing'}")
-        report.append(f"Flux directory: {'✅ Present' if structure['flux_directory'] else '❌ Missing'}")
+        line("DIRECTORY STRUCTURE ANALYSIS:")
+        line(_DASH40)
+        line(f"Base directory: {'✅ Present' if structure['has_base_directory'] else '❌ Missing'}")
+        line(f"Overlays directory: {'✅ Present' if structure['has_overlays_directory'] else '❌ Missing'}")
+        line(f"ArgoCD directory: {'✅ Present' if structure['argocd_directory'] else '❌ Missing'}")
+        line(f"Flux directory: {'✅ Present' if structure['flux_directory'] else '❌ Missing'}")
         
         if structure['overlay_environments']:
-            report.append(f"Overlay environments: {', '.join(structure['overlay_environments'])}")
+            line(f"Overlay environments: {', '.join(structure['overlay_environments'])}")
         
         if structure['recommendations']:
-            report.append("Recommendations:")
+            line("Recommendations:")
             for rec in structure['recommendations']:
-                report.append(f"  💡 {rec}")
-        report.append("")
+                line(f"  💡 {rec}")
+        line("")
         
         # Kustomization files validation
-        report.append("KUSTOMIZATION FILES VALIDATION:")
-        report.append("-" * 40)
-        report.append(f"Total kustomization files: {len(self.results['kustomization_files'])}")
+        line("KUSTOMIZATION FILES VALIDATION:")
+        line(_DASH40)
+        line(f"Total kustomization files: {len(self.results['kustomization_files'])}")
         
         for file_path in self.results['kustomization_files']:
-            report.append(f"\n📄 {file_path}")
+            line(f"\n📄 {file_path}")
             
             # Resource reference validation
             if file_path in self.results['resource_references']:
                 ref_result = self.results['resource_references'][file_path]
                 status = "✅ VALID" if ref_result['valid'] else "❌ INVALID"
-                report.append(f"  {status} Resource references")
+                line(f"  {status} Resource references")
                 
                 if ref_result['resources']:
-                    report.append(f"  Resources: {len(ref_result['resources'])} found")
+                    line(f"  Resources: {len(ref_result['resources'])} found")
                 if ref_result['missing_resources']:
-                    report.append(f"  ❌ Missing resources: {ref_result['missing_resources']}")
+                    line(f"  ❌ Missing resources: {ref_result['missing_resources']}")
                 
                 if ref_result['patches']:
-                    report.append(f"  Patches: {len(ref_result['patches'])} found")
+                    line(f"  Patches: {len(ref_result['patches'])} found")
                 if ref_result['missing_patches']:
-                    report.append(f"  ❌ Missing patches: {ref_result['missing_patches']}")
+                    line(f"  ❌ Missing patches: {ref_result['missing_patches']}")
                 
                 for error in ref_result['errors']:
-                    report.append(f"  ❌ {error}")
+                    line(f"  ❌ {error}")
                 for warning in ref_result['warnings']:
-                    report.append(f"  ⚠️  {warning}")
+                    line(f"  ⚠️  {warning}")
             
             # Kustomize build results
             if file_path in self.results['kustomize_build_results']:
                 build_result = self.results['kustomize_build_results'][file_path]
                 status = "✅ SUCCESS" if build_result['build_successful'] else "❌ FAILED"
-                report.append(f"  {status} Kustomize build")
+                line(f"  {status} Kustomize build")
                 
                 if build_result['build_successful']:
-                    report.append(f"    Manifests generated: {build_result['manifest_count']}")
+                    line(f"    Manifests generated: {build_result['manifest_count']}")
                     if build_result['resource_types']:
-                        report.append(f"    Resource types: {', '.join(build_result['resource_types'])}")
+                        line(f"    Resource types: {', '.join(build_result['resource_types'])}")
                 
                 for error in build_result['errors']:
-                    report.append(f"    ❌ {error}")
+                    line(f"    ❌ {error}")
         
         # ArgoCD applications
         if self.results['argocd_applications']:
-            report.append(f"\nARGOCD APPLICATIONS:")
-            report.append("-" * 40)
-            report.append(f"Total applications: {len(self.results['argocd_applications'])}")
+            line(f"\nARGOCD APPLICATIONS:")
+            line(_DASH40)
+            line(f"Total applications: {len(self.results['argocd_applications'])}")
             
             for app in self.results['argocd_applications']:
                 status = "✅ VALID" if app['valid'] else "❌ INVALID"
-                report.append(f"{status} {app['name']} ({app['file']})")
-                report.append(f"  Destination: {app['destination_cluster']}/{app['destination_namespace']}")
+                line(f"{status} {app['name']} ({app['file']})")
+                line(f"  Destination: {app['destination_cluster']}/{app['destination_namespace']}")
                 
                 for error in app['errors']:
-                    report.append(f"  ❌ {error}")
+                    line(f"  ❌ {error}")
                 for warning in app['warnings']:
-                    report.append(f"  ⚠️  {warning}")
+                    line(f"  ⚠️  {warning}")
         
         # Flux manifests
         if self.results['flux_manifests']:
-            report.append(f"\nFLUX MANIFESTS:")
-            report.append("-" * 40)
-            report.append(f"Total Flux manifests: {len(self.results['flux_manifests'])}")
+            line(f"\nFLUX MANIFESTS:")
+            line(_DASH40)
+            line(f"Total Flux manifests: {len(self.results['flux_manifests'])}")
             
             for manifest in self.results['flux_manifests']:
                 status = "✅ VALID" if manifest['valid'] else "❌ INVALID"
-                report.append(f"{status} {manifest['kind']}/{manifest['name']} ({manifest['file']})")
+                line(f"{status} {manifest['kind']}/{manifest['name']} ({manifest['file']})")
                 
                 for error in manifest['errors']:
-                    report.append(f"  ❌ {error}")
+                    line(f"  ❌ {error}")
                 for warning in manifest['warnings']:
-                    report.append(f"  ⚠️  {warning}")
+                    line(f"  ⚠️  {warning}")
         
         # Summary of all errors and warnings
         if self.results['errors']:
-            report.append(f"\nALL ERRORS:")
-            report.append("-" * 40)
+            line(f"\nALL ERRORS:")
+            line(_DASH40)
             for error in self.results['errors']:
-                report.append(f"❌ {error}")
+                line(f"❌ {error}")
         
         if self.results['warnings']:
-            report.append(f"\nALL WARNINGS:")
-            report.append("-" * 40)
+            line(f"\nALL WARNINGS:")
+            line(_DASH40)
             for warning in self.results['warnings']:
-                report.append(f"⚠️  {warning}")
+                line(f"⚠️  {warning}")
         
-        report.append("")
-        return "\n".join(report)
+        line("")
+        # Drop the final newline so the output matches a "\n".join of the lines
+        return buf.getvalue()[:-1]
+
+def _dump_results(results: Dict[str, Any], path: str, pretty: bool = False):
+    """Write results as JSON, compact unless pretty is requested"""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(results, default=str, option=option))
+    else:
+        with open(path, 'w') as f:
+            if pretty:
+                json.dump(results, f, indent=2, default=str)
+            else:
+                json.dump(results, f, separators=(',', ':'), default=str)
 
 def main():
+    parser = argparse.ArgumentParser(description='Validate GitOps structure integrity')
+    parser.add_argument('--pretty', action='store_true', help='indent the JSON results file')
+    args = parser.parse_args()
+    
     project_root = os.path.dirname(os.path.abspath(__file__)) + "/.."
     validator = GitOpsValidator(project_root)
     
@@ -577,8 +786,7 @@ def main():
     print(report)
     
     # Save results to JSON
-    with open('gitops_validation_results.json', 'w') as f:
-        json.dump(results, f, indent=2, default=str)
+    _dump_results(results, 'gitops_validation_results.json', pretty=args.pretty)
     
     # Exit code based on validation results
     exit_code = 1 if results['errors'] else 0
@@ -3,12 +3,55 @@
 Kubernetes Compliance Validation Script
 Tests kubectl dry-run, schema validation, and Kubernetes best practices
 """
+import io
 import os
+import re
 import json
 import subprocess
+import tempfile
 import yaml
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+try:
+    import orjson
+except ImportError:  # optional accelerator, stdlib json is used otherwise
+    orjson = None
+
+# Directories never descended into while looking for manifests
+SKIP_DIRS = frozenset({'claudedocs', 'node_modules', '.git', 'backup-source'})
+
+# Most kubectl stderr kept per invocation
+KUBECTL_STDERR_LIMIT = 64 * 1024
+# Upper bound on a batched kubectl dry-run, however many files it covers
+KUBECTL_BATCH_TIMEOUT = 300
+
+# Kinds whose pod template gets resource checks, and those checked for a security context
+_WORKLOAD_KINDS = frozenset({'Deployment', 'StatefulSet', 'DaemonSet'})
+_POD_KINDS = _WORKLOAD_KINDS | {'Pod'}
+# Labels expected on every resource, in report order
+RECOMMENDED_LABELS = ('app', 'version', 'component')
+
+_K8S_NAME_RE = re.compile(r'^[a-z0-9]([-a-z0-9]*[a-z0-9])?$')
+
+@dataclass(slots=True)
+class ManifestResult:
+    """Schema and best-practice findings for one document of a manifest file"""
+    document_index: int
+    valid: bool = True
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    kind: str = 'Unknown'
+    apiVersion: str = 'Unknown'
+    name: str = 'Unknown'
+    namespace: str = 'default'
 
 class KubernetesValidator:
     def __init__(self, project_root: str):
@@ -24,6 +67,9 @@ class KubernetesValidator:
             'warnings': [],
             'errors': []
         }
+        # Parsed documents of discovered manifests, reused by schema validation
+        self._doc_cache: Dict[Path, list] = {}
+        self._rel_cache: Dict[Path, str] = {}
         self.check_kubectl()
     
     def check_kubectl(self):
@@ -40,57 +86,95 @@ class KubernetesValidator:
             print(f"❌ kubectl check failed: {e}")
             self.results['kubectl_available'] = False
     
+    def _rel(self, path: Path) -> str:
+        """Project-relative path string, computed once per path"""
+        rel = self._rel_cache.get(path)
+        if rel is None:
+            rel = self._rel_cache[path] = str(path.relative_to(self.project_root))
+        return rel
+    
+    def _walk_yaml_files(self) -> List[Path]:
+        """List YAML files with a single os.walk, pruning skipped directories"""
+        yaml_files = []
+        for dirpath, dirnames, filenames in os.walk(self.project_root):
+            # Prune in place so excluded subtrees are never listed
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            
+            for name in filenames:
+                if name.endswith(('.yaml', '.yml')):
+                    yaml_files.append(Path(dirpath, name))
+        return yaml_files
+    
     def find_kubernetes_manifests(self) -> List[Path]:
         """Find Kubernetes manifest files"""
         k8s_files = []
         
         # Look for YAML files that are likely Kubernetes manifests
-        yaml_files = list(self.project_root.glob('**/*.yaml'))
-        yaml_files.extend(list(self.project_root.glob('**/*.yml')))
-        
-        for file_path in yaml_files:
-            # Skip certain directories and files but include base directory
-            skip_patterns = ['claudedocs', 'node_modules', '.git', 'backup-source']
-            if any(pattern in str(file_path) for pattern in skip_patterns):
-                continue
-                
+        for file_path in self._walk_yaml_files():
             try:
-                with open(file_path, 'r') as f:
-                    content = f.read()
-                    # Check if it's a Kubernetes manifest
-                    if self.is_kubernetes_manifest(content):
-                        k8s_files.append(file_path)
+                with open(file_path, 'rb') as f:
+                    raw = f.read()
+                
+                # Files without both top-level keys anywhere cannot hold a
+                # manifest; skip them without invoking the YAML parser
+                if b'apiVersion' not in raw or b'kind' not in raw:
+                    continue
+                
+                # Check if it's a Kubernetes manifest
+                docs = self.parse_documents(raw.decode())
+                if docs is not None and self.is_kubernetes_manifest(docs):
+                    k8s_files.append(file_path)
+                    self._doc_cache[file_path] = docs
             except Exception as e:
                 self.results['warnings'].append(f"Could not read {file_path}: {e}")
         
         return sorted(k8s_files)
     
-    def is_kubernetes_manifest(self, content: str) -> bool:
-        """Check if YAML content is a Kubernetes manifest"""
+    def parse_documents(self, content: str) -> Optional[list]:
+        """Parse all YAML documents in content, or None if it is not valid YAML"""
         try:
-            docs = list(yaml.safe_load_all(content))
-            for doc in docs:
-                if doc and isinstance(doc, dict):
-                    # Look for Kubernetes-specific fields
-                    if 'apiVersion' in doc and 'kind' in doc:
-                        # Skip kustomization files - they'll be handled by GitOps validator
-                        kind = doc.get('kind', '')
-                        api_version = doc.get('apiVersion', '')
-                        
-                        # Skip all Kustomization types
-                        if kind == 'Kustomization':
-                            continue
-                            
-                        # This is a standard Kubernetes resource
-                        return True
-        except:
-            pass
+            return list(yaml.load_all(content, Loader=_SafeLoader))
+        except yaml.YAMLError:
+            return None
+    
+    def is_kubernetes_manifest(self, docs: list) -> bool:
+        """Check if parsed YAML documents contain a Kubernetes manifest"""
+        for doc in docs:
+            if doc and isinstance(doc, dict):
+                # Look for Kubernetes-specific fields
+                if 'apiVersion' in doc and 'kind' in doc:
+                    # Skip all Kustomization types - they'll be handled by GitOps validator
+                    if doc.get('kind', '') == 'Kustomization':
+                        continue
+                    
+                    # This is a standard Kubernetes resource
+                    return True
         return False
     
+    def _run_kubectl(self, cmd: List[str], timeout: float) -> Tuple[int, bytes, bytes]:
+        """Run kubectl, returning (returncode, stdout, stderr)
+        
+        stderr is spooled to a temporary file and at most KUBECTL_STDERR_LIMIT
+        bytes of it are read back, so a runaway error dump is never held in memory.
+        """
+        with tempfile.TemporaryFile() as stderr_file:
+            with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file) as process:
+                try:
+                    stdout, _ = process.communicate(timeout=timeout)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.communicate()
+                    raise
+            
+            stderr_file.seek(0)
+            stderr = stderr_file.read(KUBECTL_STDERR_LIMIT)
+        
+        return process.returncode, stdout, stderr
+    
     def validate_with_kubectl_dry_run(self, file_path: Path) -> Dict[str, Any]:
         """Validate manifest using kubectl dry-run"""
         result = {
-            'file': str(file_path.relative_to(self.project_root)),
+            'file': self._rel(file_path),
             'valid': False,
             'warnings': [],
             'errors': [],
@@ -104,17 +188,18 @@ class KubernetesValidator:
         try:
             # Try dry-run validation
             cmd = ['kubectl', 'apply', '--dry-run=client', '-f', str(file_path)]
-            process = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            returncode, stdout, stderr = self._run_kubectl(cmd, timeout=30)
             
-            result['output'] = process.stdout + process.stderr
-            result['valid'] = process.returncode == 0
+            # Check for deprecation warnings; kubectl reports them on stderr
+            if b'deprecated' in stderr.lower():
+                result['warnings'].append('Contains deprecated API versions')
             
-            if not result['valid']:
-                result['errors'].append(f"kubectl dry-run failed: {process.stderr}")
+            stderr = stderr.decode('utf-8', errors='replace')
+            result['output'] = stdout.decode('utf-8', errors='replace') + stderr
+            result['valid'] = returncode == 0
             
-            # Check for deprecation warnings
-            if 'deprecated' in result['output'].lower():
-                result['warnings'].append('Contains deprecated API versions')
+            if not result['valid']:
+                result['errors'].append(f"kubectl dry-run failed: {stderr}")
             
         except subprocess.TimeoutExpired:
             result['errors'].append('kubectl dry-run timed out')
@@ -123,53 +208,103 @@ class KubernetesValidator:
         
         return result
     
+    def validate_with_kubectl_batch(self, files: List[Path]) -> Optional[List[Dict[str, Any]]]:
+        """Validate manifests with a single kubectl dry-run over all files
+        
+        Returns per-file results in the order of files, or None when the
+        outcome cannot be attributed to individual files (errors, warnings,
+        or unexpected output) and each file must be dry-run on its own.
+        """
+        # kubectl prints one line per object, in file order
+        object_counts = []
+        for file_path in files:
+            docs = self._doc_cache.get(file_path)
+            if docs is None:
+                return None
+            count = 0
+            for doc in docs:
+                if doc is None:
+                    continue
+                if not isinstance(doc, dict) or str(doc.get('kind', '')).endswith('List'):
+                    return None
+                count += 1
+            object_counts.append(count)
+        
+        cmd = ['kubectl', 'apply', '--dry-run=client']
+        for file_path in files:
+            cmd += ['-f', str(file_path)]
+        
+        try:
+            returncode, stdout, stderr = self._run_kubectl(cmd, timeout=min(30 * len(files), KUBECTL_BATCH_TIMEOUT))
+            lines = stdout.decode('utf-8', errors='replace').splitlines(keepends=True)
+        except Exception:
+            return None
+        
+        if returncode != 0 or stderr or len(lines) != sum(object_counts):
+            return None
+        
+        results = []
+        start = 0
+        for file_path, count in zip(files, object_counts):
+            output = ''.join(lines[start:start + count])
+            start += count
+            # Deprecation warnings would have been on stderr, which is empty here
+            results.append({
+                'file': self._rel(file_path),
+                'valid': True,
+                'warnings': [],
+                'errors': [],
+                'output': output
+            })
+        
+        return results
+    
     def validate_kubernetes_schema(self, file_path: Path) -> Dict[str, Any]:
         """Validate Kubernetes manifest schema"""
         result = {
-            'file': str(file_path.relative_to(self.project_root)),
+            'file': self._rel(file_path),
             'manifests': [],
             'errors': [],
             'warnings': []
         }
         
         try:
-            with open(file_path, 'r') as f:
-                content = f.read()
+            docs = self._doc_cache.get(file_path)
+            if docs is None:
+                # libyaml reads the file object directly; no need to hold the text
+                with open(file_path, 'rb') as f:
+                    docs = list(yaml.load_all(f, Loader=_SafeLoader))
             
-            docs = list(yaml.safe_load_all(content))
             for i, doc in enumerate(docs):
                 if not doc:
                     continue
                     
-                manifest_result = {
-                    'document_index': i,
-                    'valid': True,
-                    'errors': [],
-                    'warnings': [],
-                    'kind': doc.get('kind', 'Unknown'),
-                    'apiVersion': doc.get('apiVersion', 'Unknown'),
-                    'name': doc.get('metadata', {}).get('name', 'Unknown'),
-                    'namespace': doc.get('metadata', {}).get('namespace', 'default')
-                }
+                metadata = doc.get('metadata', {})
+                manifest_result = ManifestResult(
+                    document_index=i,
+                    kind=doc.get('kind', 'Unknown'),
+                    apiVersion=doc.get('apiVersion', 'Unknown'),
+                    name=metadata.get('name', 'Unknown'),
+                    namespace=metadata.get('namespace', 'default')
+                )
                 
                 # Basic schema validation
                 required_fields = ['apiVersion', 'kind']
-                for field in required_fields:
-                    if field not in doc:
-                        manifest_result['errors'].append(f'Missing required field: {field}')
-                        manifest_result['valid'] = False
+                for field_name in required_fields:
+                    if field_name not in doc:
+                        manifest_result.errors.append(f'Missing required field: {field_name}')
+                        manifest_result.valid = False
                 
                 # Metadata validation
                 if 'metadata' in doc:
-                    metadata = doc['metadata']
                     if 'name' not in metadata:
-                        manifest_result['errors'].append('Missing metadata.name')
-                        manifest_result['valid'] = False
+                        manifest_result.errors.append('Missing metadata.name')
+                        manifest_result.valid = False
                     
                     # Check name format
                     name = metadata.get('name', '')
                     if name and not self.is_valid_k8s_name(name):
-                        manifest_result['warnings'].append(f'Name "{name}" may not follow Kubernetes naming conventions')
+                        manifest_result.warnings.append(f'Name "{name}" may not follow Kubernetes naming conventions')
                 
                 # Check for common issues
                 self.check_best_practices(doc, manifest_result)
@@ -183,63 +318,80 @@ class KubernetesValidator:
     
     def is_valid_k8s_name(self, name: str) -> bool:
         """Check if name follows Kubernetes naming conventions"""
-        import re
         # Kubernetes names must be lowercase alphanumeric or '-', max 253 chars
-        pattern = r'^[a-z0-9]([-a-z0-9]*[a-z0-9])?$'
-        return bool(re.match(pattern, name)) and len(name) <= 253
+        return len(name) <= 253 and _K8S_NAME_RE.match(name) is not None
     
-    def check_best_practices(self, manifest: dict, result: dict):
+    def check_best_practices(self, manifest: dict, result: 'ManifestResult'):
         """Check Kubernetes best practices"""
         kind = manifest.get('kind', '')
         
-        # Check for resource limits and requests
-        if kind in ['Deployment', 'StatefulSet', 'DaemonSet']:
-            spec = manifest.get('spec', {})
-            template = spec.get('template', {})
-            pod_spec = template.get('spec', {})
-            containers = pod_spec.get('containers', [])
-            
-            for container in containers:
-                resources = container.get('resources', {})
-                if not resources.get('limits'):
-                    result['warnings'].append(f'Container "{container.get("name", "unknown")}" missing resource limits')
-                if not resources.get('requests'):
-                    result['warnings'].append(f'Container "{container.get("name", "unknown")}" missing resource requests')
-        
-        # Check for security contexts
-        if kind in ['Deployment', 'StatefulSet', 'DaemonSet', 'Pod']:
+        if kind in _POD_KINDS:
             if kind == 'Pod':
                 pod_spec = manifest.get('spec', {})
             else:
                 pod_spec = manifest.get('spec', {}).get('template', {}).get('spec', {})
             
+            # Check for resource limits and requests
+            if kind in _WORKLOAD_KINDS:
+                for container in pod_spec.get('containers', []):
+                    resources = container.get('resources', {})
+                    if not resources.get('limits'):
+                        result.warnings.append(f'Container "{container.get("name", "unknown")}" missing resource limits')
+                    if not resources.get('requests'):
+                        result.warnings.append(f'Container "{container.get("name", "unknown")}" missing resource requests')
+            
+            # Check for security contexts
             if not pod_spec.get('securityContext'):
-                result['warnings'].append('Missing pod security context')
+                result.warnings.append('Missing pod security context')
         
         # Check for labels and selectors
         metadata = manifest.get('metadata', {})
         labels = metadata.get('labels', {})
         
-        recommended_labels = ['app', 'version', 'component']
-        missing_labels = [label for label in recommended_labels if label not in labels]
+        missing_labels = [label for label in RECOMMENDED_LABELS if label not in labels]
         if missing_labels:
-            result['warnings'].append(f'Missing recommended labels: {missing_labels}')
+            result.warnings.append(f'Missing recommended labels: {missing_labels}')
     
     def validate_all_manifests(self) -> Dict[str, Any]:
         """Validate all Kubernetes manifests"""
         k8s_files = self.find_kubernetes_manifests()
-        self.results['kubernetes_files'] = [str(f.relative_to(self.project_root)) for f in k8s_files]
+        self.results['kubernetes_files'] = [self._rel(f) for f in k8s_files]
         self.results['total_manifests'] = len(k8s_files)
         
         print(f"Found {len(k8s_files)} Kubernetes manifest files")
         
-        for file_path in k8s_files:
-            print(f"Validating: {file_path.relative_to(self.project_root)}")
+        # kubectl dry-runs spend their time waiting on a subprocess, so run
+        # them on a thread pool while schema validation proceeds here.
+        # Results are merged in file order.
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4)) as executor:
+            if self.results['kubectl_available'] and k8s_files:
+                batch = executor.submit(self.validate_with_kubectl_batch, k8s_files)
             
-            # Kubectl dry-run validation
-            if self.results['kubectl_available']:
-                dry_run_result = self.validate_with_kubectl_dry_run(file_path)
-                self.results['dry_run_results'][str(file_path.relative_to(self.project_root))] = dry_run_result
+            for file_path in k8s_files:
+                print(f"Validating: {self._rel(file_path)}")
+                
+                # Schema validation
+                schema_result = self.validate_kubernetes_schema(file_path)
+                self.results['schema_validation'][self._rel(file_path)] = schema_result
+                
+                # Collect warnings
+                for manifest in schema_result['manifests']:
+                    if manifest.warnings:
+                        self.results['warnings'].extend([
+                            f"{schema_result['file']}: {warning}" 
+                            for warning in manifest.warnings
+                        ])
+            
+            # Kubectl dry-run validation, one invocation for all files unless
+            # results have to be attributed by running each file separately
+            dry_run_results = []
+            if self.results['kubectl_available'] and k8s_files:
+                dry_run_results = batch.result()
+                if dry_run_results is None:
+                    dry_run_results = executor.map(self.validate_with_kubectl_dry_run, k8s_files)
+            
+            for file_path, dry_run_result in zip(k8s_files, dry_run_results):
+                self.results['dry_run_results'][self._rel(file_path)] = dry_run_result
                 
                 if dry_run_result['valid']:
                     self.results['valid_manifests'] += 1
@@ -248,94 +400,89 @@ class KubernetesValidator:
                         f"{dry_run_result['file']}: {error}" 
                         for error in dry_run_result['errors']
                     ])
-            
-            # Schema validation
-            schema_result = self.validate_kubernetes_schema(file_path)
-            self.results['schema_validation'][str(file_path.relative_to(self.project_root))] = schema_result
-            
-            # Collect warnings
-            for manifest in schema_result['manifests']:
-                if manifest['warnings']:
-                    self.results['warnings'].extend([
-                        f"{schema_result['file']}: {warning}" 
-                        for warning in manifest['warnings']
-                    ])
         
         return self.results
     
     def generate_report(self) -> str:
         """Generate comprehensive Kubernetes validation report"""
-        report = []
-        report.append("=" * 80)
-        report.append("KUBERNETES COMPLIANCE VALIDATION REPORT")
-        report.append("=" * 80)
-        report.append(f"kubectl available: {'Yes' if self.results['kubectl_available'] else 'No'}")
-        report.append(f"Total manifest files: {self.results['total_manifests']}")
-        report.append(f"Valid manifests (dry-run): {self.results['valid_manifests']}")
+        buf = io.StringIO()
+        w = buf.write
+        
+        def line(text: str = '') -> None:
+            w(text)
+            w('\n')
+        
+        line("=" * 80)
+        line("KUBERNETES COMPLIANCE VALIDATION REPORT")
+        line("=" * 80)
+        line(f"kubectl available: {'Yes' if self.results['kubectl_available'] else 'No'}")
+        line(f"Total manifest files: {self.results['total_manifests']}")
+        line(f"Valid manifests (dry-run): {self.results['valid_manifests']}")
         
         if self.results['total_manifests'] > 0:
             success_rate = (self.results['valid_manifests'] / self.results['total_manifests'] * 100)
-            report.append(f"Success rate: {success_rate:.1f}%")
-        report.append("")
+            line(f"Success rate: {success_rate:.1f}%")
+        line("")
         
         # Files found
-        report.append("KUBERNETES MANIFEST FILES:")
-        report.append("-" * 40)
+        line("KUBERNETES MANIFEST FILES:")
+        line("-" * 40)
         for file_path in self.results['kubernetes_files']:
-            report.append(f"📄 {file_path}")
-        report.append("")
+            line(f"📄 {file_path}")
+        line("")
         
         # Dry-run results
         if self.results['dry_run_results']:
-            report.append("KUBECTL DRY-RUN RESULTS:")
-            report.append("-" * 40)
+            line("KUBECTL DRY-RUN RESULTS:")
+            line("-" * 40)
             for file_path, result in self.results['dry_run_results'].items():
                 status = "✅ VALID" if result['valid'] else "❌ INVALID"
-                report.append(f"{status} {file_path}")
+                line(f"{status} {file_path}")
                 if result['errors']:
                     for error in result['errors']:
-                        report.append(f"  ❌ {error}")
+                        line(f"  ❌ {error}")
                 if result['warnings']:
                     for warning in result['warnings']:
-                        report.append(f"  ⚠️  {warning}")
-            report.append("")
+                        line(f"  ⚠️  {warning}")
+            line("")
         
         # Schema validation results
         if self.results['schema_validation']:
-            report.append("SCHEMA VALIDATION RESULTS:")
-            report.append("-" * 40)
+            line("SCHEMA VALIDATION RESULTS:")
+            line("-" * 40)
             for file_path, result in self.results['schema_validation'].items():
-                report.append(f"📄 {file_path}")
+                line(f"📄 {file_path}")
                 for manifest in result['manifests']:
-                    status = "✅ VALID" if manifest['valid'] else "❌ INVALID"
-                    report.append(f"  {status} {manifest['kind']}/{manifest['name']}")
-                    report.append(f"    API Version: {manifest['apiVersion']}")
-                    report.append(f"    Namespace: {manifest['namespace']}")
+                    status = "✅ VALID" if manifest.valid else "❌ INVALID"
+                    line(f"  {status} {manifest.kind}/{manifest.name}")
+                    line(f"    API Version: {manifest.apiVersion}")
+                    line(f"    Namespace: {manifest.namespace}")
                     
-                    if manifest['errors']:
-                        for error in manifest['errors']:
-                            report.append(f"    ❌ {error}")
-                    if manifest['warnings']:
-                        for warning in manifest['warnings']:
-                            report.append(f"    ⚠️  {warning}")
-                report.append("")
+                    if manifest.errors:
+                        for error in manifest.errors:
+                            line(f"    ❌ {error}")
+                    if manifest.warnings:
+                        for warning in manifest.warnings:
+                            line(f"    ⚠️  {warning}")
+                line("")
         
         # Summary of all errors and warnings
         if self.results['errors']:
-            report.append("ALL ERRORS:")
-            report.append("-" * 40)
+            line("ALL ERRORS:")
+            line("-" * 40)
             for error in self.results['errors']:
-                report.append(f"❌ {error}")
-            report.append("")
+                line(f"❌ {error}")
+            line("")
         
         if self.results['warnings']:
-            report.append("ALL WARNINGS:")
-            report.append("-" * 40)
+            line("ALL WARNINGS:")
+            line("-" * 40)
             for warning in self.results['warnings']:
-                report.append(f"⚠️  {warning}")
-            report.append("")
+                line(f"⚠️  {warning}")
+            line("")
         
-        return "\n".join(report)
+        # Drop the final newline so the output matches a "\n".join of the lines
+        return buf.getvalue()[:-1]
 
 def main():
     project_root = os.path.dirname(os.path.abspath(__file__)) + "/.."
@@ -349,8 +496,12 @@ def main():
     print(report)
     
     # Save results to JSON
-    with open('kubernetes_validation_results.json', 'w') as f:
-        json.dump(results, f, indent=2)
+    if orjson is not None:
+        with open('kubernetes_validation_results.json', 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
+        with open('kubernetes_validation_results.json', 'w') as f:
+            json.dump(results, f, indent=2, default=asdict)
     
     # Exit code based on validation results
     exit_code = 1 if results['errors'] else 0
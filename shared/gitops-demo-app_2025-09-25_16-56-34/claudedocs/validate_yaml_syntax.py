@@ -3,11 +3,116 @@
 Comprehensive YAML Syntax Validation Script
 Validates all YAML files for syntax correctness, indentation, and encoding
 """
+import io
 import os
+import re
 import yaml
 import json
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Tuple, Any
+from typing import List, Dict, Tuple, Any, Optional
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+try:
+    import orjson
+except ImportError:  # optional accelerator, stdlib json is used otherwise
+    orjson = None
+
+# Directories never descended into while looking for YAML files
+SKIP_DIRS = frozenset({'.git', 'node_modules'})
+
+# Below this many files, starting worker processes costs more than it saves
+PROCESS_POOL_MIN_FILES = 32
+
+# A "---" document marker at the start of a line, alone or followed by whitespace
+_DOC_SEPARATOR_RE = re.compile(r'^---(?=[ \t\r\n]|$)', re.M)
+
+# Per-line lint checks, run as whole-content scans
+_TAB_RE = re.compile(r'\t[^\n]*')  # one match per line containing a tab
+_TRAILING_WS_RE = re.compile(r'\S[^\S\n]+$', re.M)
+_ODD_INDENT_RE = re.compile(r'^ (?:[^\S\n]{2})*(?![^\S\n])', re.M)
+
+def _count_doc_separators(content: str) -> int:
+    """Number of document markers, ignoring "---" inside values and block scalars"""
+    return sum(1 for _ in _DOC_SEPARATOR_RE.finditer(content))
+
+def _line_warnings(content: str) -> List[str]:
+    """Tab, trailing-whitespace and odd-indentation warnings, ordered by line"""
+    found = []
+    for check, regex in enumerate((_TAB_RE, _TRAILING_WS_RE, _ODD_INDENT_RE)):
+        lineno, last = 1, 0
+        for match in regex.finditer(content):
+            start = match.start()
+            lineno += content.count('\n', last, start)
+            last = start
+            found.append((lineno, check, match))
+    found.sort(key=lambda item: item[:2])
+    
+    warnings = []
+    for lineno, check, match in found:
+        if check == 0:
+            warnings.append(f'Line {lineno}: Contains tab characters (should use spaces)')
+        elif check == 1:
+            warnings.append(f'Line {lineno}: Contains trailing whitespace')
+        else:
+            warnings.append(f'Line {lineno}: Odd number of leading spaces ({len(match.group())})')
+    return warnings
+
+def validate_yaml_file(file_path: Path, rel_path: str) -> Dict[str, Any]:
+    """Validate individual YAML file syntax
+    
+    Module-level so it can run in worker processes.
+    """
+    result = {
+        'file': rel_path,
+        'valid': False,
+        'errors': [],
+        'warnings': [],
+        'documents': 0,
+        'size_bytes': 0,
+        'encoding': 'unknown'
+    }
+    
+    try:
+        # Get file stats
+        result['size_bytes'] = file_path.stat().st_size
+        
+        # Read file with encoding detection
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            result['encoding'] = 'utf-8'
+        except UnicodeDecodeError:
+            with open(file_path, 'r', encoding='latin-1') as f:
+                content = f.read()
+            result['encoding'] = 'latin-1'
+            result['warnings'].append('File not UTF-8 encoded')
+        
+        # Parse YAML documents
+        # Count as the stream is loaded so only one document is alive at a time
+        result['documents'] = sum(doc is not None for doc in yaml.load_all(content, Loader=_SafeLoader))
+        
+        # Additional syntax checks
+        if '---' in content:
+            doc_separators = _count_doc_separators(content)
+            if doc_separators != result['documents'] - 1 and result['documents'] > 1:
+                result['warnings'].append(f'Document separator count mismatch: {doc_separators} separators for {result["documents"]} documents')
+        
+        # Check for common YAML issues
+        result['warnings'].extend(_line_warnings(content))
+        
+        result['valid'] = True
+    
+    except yaml.YAMLError as e:
+        result['errors'].append(f'YAML parsing error: {str(e)}')
+    except Exception as e:
+        result['errors'].append(f'General error: {str(e)}')
+    
+    return result
 
 class YAMLValidator:
     def __init__(self, project_root: str):
@@ -24,72 +129,20 @@ class YAMLValidator:
     def find_yaml_files(self) -> List[Path]:
         """Find all YAML files in the project"""
         yaml_files = []
-        for pattern in ['**/*.yaml', '**/*.yml']:
-            yaml_files.extend(self.project_root.glob(pattern))
+        for dirpath, dirnames, filenames in os.walk(self.project_root):
+            # Prune in place so excluded subtrees are never listed
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            
+            for name in filenames:
+                if name.endswith(('.yaml', '.yml')):
+                    yaml_files.append(Path(dirpath, name))
         return sorted(yaml_files)
     
-    def validate_yaml_syntax(self, file_path: Path) -> Dict[str, Any]:
+    def validate_yaml_syntax(self, file_path: Path, rel_path: Optional[str] = None) -> Dict[str, Any]:
         """Validate individual YAML file syntax"""
-        result = {
-            'file': str(file_path.relative_to(self.project_root)),
-            'valid': False,
-            'errors': [],
-            'warnings': [],
-            'documents': 0,
-            'size_bytes': 0,
-            'encoding': 'unknown'
-        }
-        
-        try:
-            # Get file stats
-            result['size_bytes'] = file_path.stat().st_size
-            
-            # Read file with encoding detection
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                result['encoding'] = 'utf-8'
-            except UnicodeDecodeError:
-                with open(file_path, 'r', encoding='latin-1') as f:
-                    content = f.read()
-                result['encoding'] = 'latin-1'
-                result['warnings'].append('File not UTF-8 encoded')
-            
-            # Parse YAML documents
-            documents = list(yaml.safe_load_all(content))
-            result['documents'] = len([doc for doc in documents if doc is not None])
-            
-            # Additional syntax checks
-            if '---' in content:
-                doc_separators = content.count('---')
-                if doc_separators != result['documents'] - 1 and result['documents'] > 1:
-                    result['warnings'].append(f'Document separator count mismatch: {doc_separators} separators for {result["documents"]} documents')
-            
-            # Check for common YAML issues
-            lines = content.split('\n')
-            for i, line in enumerate(lines, 1):
-                # Check for tab characters
-                if '\t' in line:
-                    result['warnings'].append(f'Line {i}: Contains tab characters (should use spaces)')
-                
-                # Check for trailing spaces
-                if line.rstrip() != line and line.strip():
-                    result['warnings'].append(f'Line {i}: Contains trailing whitespace')
-                
-                # Check for mixed indentation
-                if line.startswith(' ') and line.lstrip() != line:
-                    leading_spaces = len(line) - len(line.lstrip())
-                    if leading_spaces % 2 != 0:
-                        result['warnings'].append(f'Line {i}: Odd number of leading spaces ({leading_spaces})')
-            
-            result['valid'] = True
-            
-        except yaml.YAMLError as e:
-            result['errors'].append(f'YAML parsing error: {str(e)}')
-        except Exception as e:
-            result['errors'].append(f'General error: {str(e)}')
-        
-        return result
+        if rel_path is None:
+            rel_path = str(file_path.relative_to(self.project_root))
+        return validate_yaml_file(file_path, rel_path)
     
     def validate_all_files(self) -> Dict[str, Any]:
         """Validate all YAML files in the project"""
@@ -98,10 +151,22 @@ class YAMLValidator:
         
         print(f"Found {len(yaml_files)} YAML files to validate")
         
+        rel_paths = []
         for file_path in yaml_files:
-            print(f"Validating: {file_path.relative_to(self.project_root)}")
-            file_result = self.validate_yaml_syntax(file_path)
-            
+            rel_path = str(file_path.relative_to(self.project_root))
+            print(f"Validating: {rel_path}")
+            rel_paths.append(rel_path)
+        
+        # Parsing and linting are CPU-bound and independent per file, so large
+        # trees are spread over worker processes; results come back in file order
+        workers = os.cpu_count() or 1
+        if workers > 1 and len(yaml_files) >= PROCESS_POOL_MIN_FILES:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                file_results = list(executor.map(validate_yaml_file, yaml_files, rel_paths, chunksize=8))
+        else:
+            file_results = map(validate_yaml_file, yaml_files, rel_paths)
+        
+        for file_result in file_results:
             if file_result['valid']:
                 self.results['valid_files'] += 1
             else:
@@ -124,55 +189,62 @@ class YAMLValidator:
     
     def generate_report(self) -> str:
         """Generate comprehensive validation report"""
-        report = []
-        report.append("=" * 80)
-        report.append("YAML SYNTAX VALIDATION REPORT")
-        report.append("=" * 80)
-        report.append(f"Total files scanned: {self.results['total_files']}")
-        report.append(f"Valid files: {self.results['valid_files']}")
-        report.append(f"Invalid files: {self.results['invalid_files']}")
-        report.append(f"Files with warnings: {len([f for f in self.results['file_details'].values() if f['warnings']])}")
+        buf = io.StringIO()
+        w = buf.write
+        
+        def line(text: str = '') -> None:
+            w(text)
+            w('\n')
+        
+        line("=" * 80)
+        line("YAML SYNTAX VALIDATION REPORT")
+        line("=" * 80)
+        line(f"Total files scanned: {self.results['total_files']}")
+        line(f"Valid files: {self.results['valid_files']}")
+        line(f"Invalid files: {self.results['invalid_files']}")
+        line(f"Files with warnings: {len([f for f in self.results['file_details'].values() if f['warnings']])}")
         
         success_rate = (self.results['valid_files'] / self.results['total_files'] * 100) if self.results['total_files'] > 0 else 0
-        report.append(f"Success rate: {success_rate:.1f}%")
-        report.append("")
+        line(f"Success rate: {success_rate:.1f}%")
+        line("")
         
         # Errors section
         if self.results['errors']:
-            report.append("ERRORS:")
-            report.append("-" * 40)
+            line("ERRORS:")
+            line("-" * 40)
             for error in self.results['errors']:
-                report.append(f"❌ {error}")
-            report.append("")
+                line(f"❌ {error}")
+            line("")
         
         # Warnings section
         if self.results['warnings']:
-            report.append("WARNINGS:")
-            report.append("-" * 40)
+            line("WARNINGS:")
+            line("-" * 40)
             for warning in self.results['warnings']:
-                report.append(f"⚠️  {warning}")
-            report.append("")
+                line(f"⚠️  {warning}")
+            line("")
         
         # File details
-        report.append("FILE DETAILS:")
-        report.append("-" * 40)
+        line("FILE DETAILS:")
+        line("-" * 40)
         for file_path, details in self.results['file_details'].items():
             status = "✅ VALID" if details['valid'] else "❌ INVALID"
-            report.append(f"{status} {file_path}")
-            report.append(f"  Documents: {details['documents']}")
-            report.append(f"  Size: {details['size_bytes']} bytes")
-            report.append(f"  Encoding: {details['encoding']}")
+            line(f"{status} {file_path}")
+            line(f"  Documents: {details['documents']}")
+            line(f"  Size: {details['size_bytes']} bytes")
+            line(f"  Encoding: {details['encoding']}")
             if details['errors']:
-                report.append("  Errors:")
+                line("  Errors:")
                 for error in details['errors']:
-                    report.append(f"    - {error}")
+                    line(f"    - {error}")
             if details['warnings']:
-                report.append("  Warnings:")
+                line("  Warnings:")
                 for warning in details['warnings']:
-                    report.append(f"    - {warning}")
-            report.append("")
+                    line(f"    - {warning}")
+            line("")
         
-        return "\n".join(report)
+        # Drop the final newline so the output matches a "\n".join of the lines
+        return buf.getvalue()[:-1]
 
 def main():
     project_root = os.path.dirname(os.path.abspath(__file__)) + "/.."
@@ -186,8 +258,12 @@ def main():
     print(report)
     
     # Save results to JSON for further processing
-    with open('yaml_validation_results.json', 'w') as f:
-        json.dump(results, f, indent=2)
+    if orjson is not None:
+        with open('yaml_validation_results.json', 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
+        with open('yaml_validation_results.json', 'w') as f:
+            json.dump(results, f, indent=2)
     
     # Exit with non-zero code if there are errors
     exit_code = 1 if results['invalid_files'] > 0 else 0
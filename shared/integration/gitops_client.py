@@ -7,21 +7,178 @@ and communicating with the integration bridge.
 """
 
 import asyncio
+import copy
 import json
 import logging
+import sys
 import time
-from dataclasses import dataclass, asdict
+from collections import OrderedDict
+from dataclasses import dataclass, is_dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Union
+from typing import AsyncIterator, Dict, List, Optional, Any, Tuple, Union
 from urllib.parse import urljoin
 
 import aiohttp
 import yaml
 
+try:
+    import orjson
+except ImportError:  # optional accelerator, stdlib json is used otherwise
+    orjson = None
+
+try:
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:  # optional accelerator, datetime.fromisoformat is used otherwise
+    if sys.version_info >= (3, 11):
+        # Accepts a trailing "Z" natively
+        _parse_datetime = datetime.fromisoformat
+    else:
+        def _parse_datetime(value: str) -> datetime:
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode values the JSON encoders do not handle natively"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, timedelta):
+        return obj.total_seconds()
+    if is_dataclass(obj):
+        # Shallow field dict; nested values are encoded by the same hook, so
+        # there is no need for asdict's recursive deep copy
+        return {name: getattr(obj, name) for name in obj.__dataclass_fields__}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_json_default)
+
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, default=_json_default).encode()
+
+    _json_loads = json.loads
+
+
+# Monitoring label sets, built once and shared by every call; monitoring
+# clients receive them read-only
+_OPERATIONS = ("start_generation", "get_status", "list_requests", "cancel_generation")
+_OUTCOMES = ("success", "failure", "failed", "not_found", "error")
+_OPERATION_LABELS = {op: {"operation": op} for op in _OPERATIONS}
+_REQUEST_LABELS = {(op, st): {"operation": op, "status": st} for op in _OPERATIONS for st in _OUTCOMES}
+_STATUS_LABELS = {st: {"status": st} for st in _OUTCOMES}
+_COMPLETION_NOTIFICATION_LABELS = {st: {"type": "completion", "status": st} for st in _OUTCOMES}
+
+# wait_for_completion polling interval bounds, in seconds
+POLL_INITIAL_DELAY = 0.25
+POLL_MAX_DELAY = 5.0
+# Status lookup errors: backoff cap in seconds, and how many in a row end the wait
+POLL_ERROR_MAX_DELAY = 30.0
+MAX_CONSECUTIVE_POLL_FAILURES = 8
+
+# Requests whose configuration has more top-level keys than this, or whose
+# encoding is estimated at more than this many bytes, are JSON-encoded off
+# the event loop
+INLINE_ENCODE_MAX_KEYS = 64
+INLINE_ENCODE_MAX_BYTES = 32 * 1024
+
+# Number of ETag-validated responses each client keeps for conditional GETs
+ETAG_CACHE_SIZE = 32
+
+# Completion notifications arriving within this many seconds of each other,
+# up to NOTIFY_BATCH_SIZE, are posted to the bridge in one request
+NOTIFY_BATCH_WINDOW = 0.1
+NOTIFY_BATCH_SIZE = 32
+# Pending notifications per client before notify_completion waits for room
+NOTIFY_QUEUE_SIZE = 1024
+
+def _new_session() -> aiohttp.ClientSession:
+    """Create an HTTP session with the client's pool and timeout settings"""
+    connector = aiohttp.TCPConnector(
+        limit=100,
+        limit_per_host=20,
+        keepalive_timeout=75,
+        enable_cleanup_closed=True
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=30),
+        # Larger reads for list responses; aiohttp defaults to 64 KiB
+        read_bufsize=2 ** 17,
+        # Compressed responses are decoded transparently. aiohttp's default
+        # Accept-Encoding offers gzip and deflate, plus br and zstd when the
+        # brotli and zstandard packages are installed, so never more than
+        # the session can decode
+        auto_decompress=True
+    )
+
+
+# Application-wide HTTP session, for callers that pass it to their clients so
+# connections are pooled and kept alive across clients and calls. A session
+# belongs to the event loop it was created on and can only be closed there.
+_shared_session: Optional[aiohttp.ClientSession] = None
+_shared_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_shared_session() -> aiohttp.ClientSession:
+    """Return the shared HTTP session for the running event loop, creating it if needed
+    
+    Raises:
+        RuntimeError: The shared session is still open on another event loop;
+            close_shared_session() must be awaited there before it exits
+    """
+    global _shared_session, _shared_session_loop
+    
+    # No await between the check and the assignment, so concurrent tasks
+    # cannot both create a session
+    loop = asyncio.get_running_loop()
+    if _shared_session is not None and not _shared_session.closed:
+        if _shared_session_loop is not loop:
+            raise RuntimeError("The shared GitOps HTTP session is open on another event loop; "
+                               "await close_shared_session() before that loop exits")
+        return _shared_session
+    
+    _shared_session = _new_session()
+    _shared_session_loop = loop
+    return _shared_session
+
+
+async def close_shared_session():
+    """Close the shared HTTP session; await it on the session's loop at shutdown"""
+    global _shared_session, _shared_session_loop
+    if _shared_session is not None:
+        await _shared_session.close()
+    _shared_session = None
+    _shared_session_loop = None
+
+
+class GitOpsClientError(Exception):
+    """A GitOps API call failed"""
+    __slots__ = ()
+
+
+class GitOpsRequestError(GitOpsClientError):
+    """The GitOps generator rejected the request with a client (4xx) error"""
+    __slots__ = ()
+
+
+class GitOpsNotFoundError(GitOpsRequestError):
+    """The GitOps generator does not know the requested id"""
+    __slots__ = ()
+
+
+# Failures to reach the service or get a response; these are wrapped in
+# GitOpsClientError, anything else propagates as is
+_TRANSPORT_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError)
+
 
-@dataclass
+@dataclass(slots=True)
 class GitOpsRequest:
     """GitOps generation request"""
     request_id: str
@@ -40,7 +197,7 @@ class GitOpsRequest:
             self.configuration = {}
 
 
-@dataclass
+@dataclass(slots=True)
 class GitOpsResponse:
     """GitOps generation response"""
     request_id: str
@@ -52,7 +209,7 @@ class GitOpsResponse:
     metadata: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GitOpsStatus:
     """GitOps generation status"""
     request_id: str
@@ -68,7 +225,7 @@ class GitOpsStatus:
     metadata: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GitOpsProgress:
     """GitOps generation progress"""
     total_resources: int
@@ -80,10 +237,79 @@ class GitOpsProgress:
     estimated_files: int
 
 
+def _exceeds_encoded_size(obj: Any, limit: int) -> bool:
+    """Estimate whether obj's JSON encoding is larger than limit bytes
+    
+    Strings count their length and containers one byte per item; the walk
+    stops as soon as the estimate passes limit, so it never costs more than
+    visiting about limit values.
+    """
+    size = 0
+    pending = [obj]
+    while pending:
+        value = pending.pop()
+        if isinstance(value, (str, bytes)):
+            size += len(value) + 2
+        elif isinstance(value, dict):
+            size += len(value) + 2
+            if size > limit:
+                return True
+            pending.extend(value.keys())
+            pending.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            size += len(value) + 2
+            if size > limit:
+                return True
+            pending.extend(value)
+        else:
+            size += 8
+        if size > limit:
+            return True
+    return False
+
+
+def _batch_results(payload: bytes, count: int) -> List[bool]:
+    """Per-notification delivery flags from a completed_batch response
+    
+    The bridge reports one result object per notification, in request order;
+    a body of any other shape counts every notification as undelivered.
+    """
+    try:
+        results = _json_loads(payload)["data"]["results"]
+        if not isinstance(results, list) or len(results) != count:
+            raise ValueError(f"expected a list of {count} results")
+        if not all(isinstance(result, dict) for result in results):
+            raise ValueError("results must be objects")
+    except (ValueError, KeyError, TypeError) as e:
+        logger.error(f"Unreadable completion batch response: {e}")
+        return [False] * count
+    
+    delivered = []
+    for result in results:
+        if not result.get("success"):
+            logger.error(f"Completion notification {result.get('id')} failed: {result.get('error')}")
+        delivered.append(bool(result.get("success")))
+    return delivered
+
+
+def _decode_status_list(payload: bytes) -> List[GitOpsStatus]:
+    """Decode a list response body into GitOpsStatus objects"""
+    requests = []
+    for item in _json_loads(payload):
+        # Convert datetime strings back to datetime objects
+        if 'start_time' in item:
+            item['start_time'] = _parse_datetime(item['start_time'])
+        if 'end_time' in item and item['end_time']:
+            item['end_time'] = _parse_datetime(item['end_time'])
+        requests.append(GitOpsStatus(**item))
+    return requests
+
+
 class GitOpsClient:
     """Client for communicating with GitOps generator and integration bridge"""
     
-    def __init__(self, config: Dict[str, Any], monitoring_client=None):
+    def __init__(self, config: Dict[str, Any], monitoring_client=None,
+                 session: Optional[aiohttp.ClientSession] = None):
         self.config = config
         self.monitoring = monitoring_client
         
@@ -94,15 +320,51 @@ class GitOpsClient:
         self.gitops_url = endpoints.get('gitops_generator', 'http://localhost:8081')
         self.bridge_url = endpoints.get('integration_bridge', 'http://localhost:8080')
         
-        # HTTP client configuration
-        timeout = aiohttp.ClientTimeout(total=30)
-        self.session = aiohttp.ClientSession(timeout=timeout)
+        # Endpoint URLs are fixed for the client's lifetime; join them once.
+        # Per-request ids are appended to the *_status/*_cancel prefixes.
+        self._url_generate = urljoin(self.gitops_url, "/api/gitops/generate")
+        self._url_status = urljoin(self.gitops_url, "/api/gitops/status/")
+        self._url_list = urljoin(self.gitops_url, "/api/gitops/list")
+        self._url_cancel = urljoin(self.gitops_url, "/api/gitops/cancel/")
+        self._url_health = urljoin(self.gitops_url, "/health")
+        self._url_register = urljoin(self.bridge_url, "/register/gitops")
+        self._url_completed = urljoin(self.bridge_url, "/webhooks/gitops/completed")
+        self._url_completed_batch = urljoin(self.bridge_url, "/webhooks/gitops/completed_batch")
+        self._url_bridge_status = urljoin(self.bridge_url, "/status")
+        
+        # HTTP client configuration. A session passed in (such as
+        # get_shared_session()) is left open on close; otherwise the client
+        # creates and owns one
+        self._owns_session = session is None
+        self.session = _new_session() if session is None else session
+        
+        # (ETag, decoded body) of recent list/health responses, least recently used first
+        self._etag_cache: "OrderedDict[Any, Tuple[str, Any]]" = OrderedDict()
+        
+        # Completion notifications waiting to be sent, with the futures their
+        # callers wait on; the flusher task is started by the first one
+        self._notify_queue: Optional[asyncio.Queue] = None
+        self._notify_task: Optional[asyncio.Task] = None
+        # Cleared once the bridge turns out not to have the batch endpoint
+        self._notify_batch_supported = True
         
         logger.info(f"GitOps client initialized - GitOps: {self.gitops_url}, Bridge: {self.bridge_url}")
     
     async def close(self):
-        """Close the HTTP session"""
-        if self.session:
+        """Send pending completion notifications and release the client
+        
+        The HTTP session is closed only if the client created it; a session
+        passed in is left open for reuse.
+        """
+        if self._notify_task is not None:
+            await self._notify_queue.join()
+            self._notify_task.cancel()
+            try:
+                await self._notify_task
+            except asyncio.CancelledError:
+                pass
+            self._notify_task = None
+        if self._owns_session:
             await self.session.close()
     
     async def __aenter__(self):
@@ -111,6 +373,67 @@ class GitOpsClient:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.close()
     
+    def _count(self, metric: str, labels: Dict[str, str]):
+        """Increment a monitoring counter, if monitoring is enabled"""
+        if self.monitoring:
+            self.monitoring.inc_counter(metric, labels)
+    
+    def _count_request(self, operation: str, status: str):
+        """Count a GitOps API request outcome"""
+        if self.monitoring:
+            self.monitoring.inc_counter("gitops_client_requests", _REQUEST_LABELS[operation, status])
+    
+    def _record_duration(self, operation: str, duration: float):
+        """Record the duration of a GitOps API request"""
+        if self.monitoring:
+            self.monitoring.record_duration("gitops_client_request_duration", _OPERATION_LABELS[operation], duration)
+    
+    async def _request(self, method: str, url: str, operation: Optional[str] = None,
+                       **kwargs) -> Tuple[int, bytes]:
+        """Send a request and return its status code and body
+        
+        When operation is given, the time until the response arrives is recorded as its duration.
+        """
+        start_time = time.perf_counter()
+        async with self.session.request(method, url, **kwargs) as response:
+            if operation is not None:
+                self._record_duration(operation, time.perf_counter() - start_time)
+            return response.status, await response.read()
+    
+    async def _conditional_get(self, url: str, decode, operation: Optional[str] = None,
+                               params: Optional[Dict[str, Any]] = None) -> Tuple[int, Any]:
+        """GET a resource, revalidating the last decoded copy with its ETag
+        
+        Returns the status code with the decoded body on 200, or the raw body
+        otherwise. A 304 answer is reported as 200 with the cached copy.
+        """
+        key = (url, tuple(params.items())) if params else url
+        cached = self._etag_cache.get(key)
+        headers = {"If-None-Match": cached[0]} if cached is not None else None
+        
+        start_time = time.perf_counter()
+        async with self.session.get(url, params=params, headers=headers) as response:
+            if operation is not None:
+                self._record_duration(operation, time.perf_counter() - start_time)
+            status = response.status
+            if status == 304 and cached is not None:
+                self._etag_cache.move_to_end(key)
+                return 200, cached[1]
+            payload = await response.read()
+            etag = response.headers.get("ETag")
+        
+        if status != 200:
+            return status, payload
+        value = decode(payload)
+        if etag:
+            self._etag_cache[key] = (etag, value)
+            self._etag_cache.move_to_end(key)
+            if len(self._etag_cache) > ETAG_CACHE_SIZE:
+                self._etag_cache.popitem(last=False)
+        elif cached is not None:
+            del self._etag_cache[key]
+        return status, value
+    
     async def register_with_bridge(self, version: str = "2.1.0") -> bool:
         """Register this GitOps client with the integration bridge"""
         try:
@@ -119,321 +442,342 @@ class GitOpsClient:
                 "version": version
             }
             
-            async with self.session.post(
-                urljoin(self.bridge_url, "/register/gitops"),
-                json=registration_data
-            ) as response:
-                if response.status == 200:
-                    logger.info("Successfully registered with integration bridge")
-                    if self.monitoring:
-                        self.monitoring.inc_counter("gitops_client_registrations", {"status": "success"})
-                    return True
-                else:
-                    logger.error(f"Registration failed with status: {response.status}")
-                    if self.monitoring:
-                        self.monitoring.inc_counter("gitops_client_registrations", {"status": "failure"})
-                    return False
+            status, _ = await self._request(
+                "POST", self._url_register,
+                data=_json_dumps(registration_data), headers=_JSON_HEADERS
+            )
+            if status == 200:
+                logger.info("Successfully registered with integration bridge")
+                self._count("gitops_client_registrations", _STATUS_LABELS["success"])
+                return True
+            else:
+                logger.error(f"Registration failed with status: {status}")
+                self._count("gitops_client_registrations", _STATUS_LABELS["failure"])
+                return False
                     
         except Exception as e:
             logger.error(f"Failed to register with bridge: {e}")
-            if self.monitoring:
-                self.monitoring.inc_counter("gitops_client_registrations", {"status": "error"})
+            self._count("gitops_client_registrations", _STATUS_LABELS["error"])
             return False
     
     async def start_gitops_generation(self, request: GitOpsRequest) -> GitOpsResponse:
         """Start GitOps generation process"""
+        # Encoding a large configuration can take long enough to stall
+        # other requests on the loop, so do it on a worker thread
+        configuration = request.configuration or {}
+        if (len(configuration) > INLINE_ENCODE_MAX_KEYS
+                or _exceeds_encoded_size(configuration, INLINE_ENCODE_MAX_BYTES)):
+            body = await asyncio.get_running_loop().run_in_executor(None, _json_dumps, request)
+        else:
+            body = _json_dumps(request)
+        
         try:
-            start_time = time.time()
-            
-            async with self.session.post(
-                urljoin(self.gitops_url, "/api/gitops/generate"),
-                json=asdict(request)
-            ) as response:
-                duration = time.time() - start_time
-                
-                if self.monitoring:
-                    self.monitoring.record_duration(
-                        "gitops_client_request_duration",
-                        {"operation": "start_generation"},
-                        duration
-                    )
-                
-                if response.status == 200:
-                    data = await response.json()
-                    gitops_response = GitOpsResponse(**data)
-                    
-                    if self.monitoring:
-                        self.monitoring.inc_counter(
-                            "gitops_client_requests",
-                            {"operation": "start_generation", "status": "success"}
-                        )
-                    
-                    return gitops_response
-                else:
-                    error_text = await response.text()
-                    if self.monitoring:
-                        self.monitoring.inc_counter(
-                            "gitops_client_requests",
-                            {"operation": "start_generation", "status": "failed"}
-                        )
-                    raise Exception(f"GitOps generation failed: {response.status} - {error_text}")
-                    
-        except Exception as e:
-            if self.monitoring:
-                self.monitoring.inc_counter(
-                    "gitops_client_requests",
-                    {"operation": "start_generation", "status": "error"}
-                )
-            raise Exception(f"Failed to start GitOps generation: {e}")
+            status, payload = await self._request(
+                "POST", self._url_generate, "start_generation",
+                data=body, headers=_JSON_HEADERS
+            )
+        except _TRANSPORT_ERRORS as e:
+            self._count_request("start_generation", "error")
+            raise GitOpsClientError(f"Failed to start GitOps generation: {e}") from e
+        
+        if status == 200:
+            gitops_response = GitOpsResponse(**_json_loads(payload))
+            self._count_request("start_generation", "success")
+            return gitops_response
+        else:
+            error_text = payload.decode("utf-8", "replace")
+            self._count_request("start_generation", "failed")
+            raise GitOpsClientError(f"GitOps generation failed: {status} - {error_text}")
     
-    async def get_gitops_status(self, request_id: str) -> GitOpsStatus:
-        """Get status of GitOps generation"""
+    async def get_gitops_status(self, request_id: str, timeout: Optional[float] = None) -> GitOpsStatus:
+        """Get status of GitOps generation
+        
+        timeout, in seconds, caps the request's total time below the session timeout.
+        """
+        request_timeout = self.session.timeout
+        if timeout is not None and (request_timeout.total is None or timeout < request_timeout.total):
+            request_timeout = aiohttp.ClientTimeout(total=timeout)
+        
         try:
-            start_time = time.time()
+            code, payload = await self._request(
+                "GET", self._url_status + request_id, "get_status",
+                timeout=request_timeout
+            )
+        except _TRANSPORT_ERRORS as e:
+            self._count_request("get_status", "error")
+            raise GitOpsClientError(f"Failed to get GitOps status: {e}") from e
+        
+        if code == 200:
+            data = _json_loads(payload)
+            # Convert datetime strings back to datetime objects
+            if 'start_time' in data:
+                data['start_time'] = _parse_datetime(data['start_time'])
+            if 'end_time' in data and data['end_time']:
+                data['end_time'] = _parse_datetime(data['end_time'])
             
-            async with self.session.get(
-                urljoin(self.gitops_url, f"/api/gitops/status/{request_id}")
-            ) as response:
-                duration = time.time() - start_time
-                
-                if self.monitoring:
-                    self.monitoring.record_duration(
-                        "gitops_client_request_duration",
-                        {"operation": "get_status"},
-                        duration
-                    )
-                
-                if response.status == 200:
-                    data = await response.json()
-                    # Convert datetime strings back to datetime objects
-                    if 'start_time' in data:
-                        data['start_time'] = datetime.fromisoformat(data['start_time'].replace('Z', '+00:00'))
-                    if 'end_time' in data and data['end_time']:
-                        data['end_time'] = datetime.fromisoformat(data['end_time'].replace('Z', '+00:00'))
-                    
-                    status = GitOpsStatus(**data)
-                    
-                    if self.monitoring:
-                        self.monitoring.inc_counter(
-                            "gitops_client_requests",
-                            {"operation": "get_status", "status": "success"}
-                        )
-                    
-                    return status
-                elif response.status == 404:
-                    if self.monitoring:
-                        self.monitoring.inc_counter(
-                            "gitops_client_requests",
-                            {"operation": "get_status", "status": "not_found"}
-                        )
-                    raise Exception(f"GitOps request not found: {request_id}")
-                else:
-                    if self.monitoring:
-                        self.monitoring.inc_counter(
-                            "gitops_client_requests",
-                            {"operation": "get_status", "status": "failed"}
-                        )
-                    raise Exception(f"Failed to get status: {response.status}")
-                    
-        except Exception as e:
-            if self.monitoring:
-                self.monitoring.inc_counter(
-                    "gitops_client_requests",
-                    {"operation": "get_status", "status": "error"}
-                )
-            raise Exception(f"Failed to get GitOps status: {e}")
+            status = GitOpsStatus(**data)
+            self._count_request("get_status", "success")
+            return status
+        elif code == 404:
+            self._count_request("get_status", "not_found")
+            raise GitOpsNotFoundError(f"GitOps request not found: {request_id}")
+        else:
+            self._count_request("get_status", "failed")
+            # Timeouts and rate limiting are worth retrying; other client errors are not
+            if 400 <= code < 500 and code not in (408, 429):
+                raise GitOpsRequestError(f"Failed to get status: {code}")
+            raise GitOpsClientError(f"Failed to get status: {code}")
+    
+    async def get_gitops_statuses(self, request_ids: List[str],
+                                  concurrency: int = 32) -> List[Union[GitOpsStatus, Exception]]:
+        """Get status of several GitOps generations concurrently
+        
+        Results are in request_ids order; a lookup that fails yields its
+        exception in place of a status.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def get_one(request_id: str) -> GitOpsStatus:
+            async with semaphore:
+                return await self.get_gitops_status(request_id)
+        
+        return await asyncio.gather(*(get_one(request_id) for request_id in request_ids),
+                                    return_exceptions=True)
     
     async def list_gitops_requests(self, limit: int = 50, offset: int = 0) -> List[GitOpsStatus]:
         """List GitOps generation requests"""
+        params = {"limit": limit, "offset": offset}
         try:
-            start_time = time.time()
+            status, requests = await self._conditional_get(
+                self._url_list, _decode_status_list, "list_requests", params=params
+            )
+        except _TRANSPORT_ERRORS as e:
+            self._count_request("list_requests", "error")
+            raise GitOpsClientError(f"Failed to list GitOps requests: {e}") from e
+        
+        if status == 200:
+            self._count_request("list_requests", "success")
+            # The list may be the cached copy; hand out one the caller can
+            # change without affecting later 304-served responses
+            return copy.deepcopy(requests)
+        else:
+            self._count_request("list_requests", "failed")
+            raise GitOpsClientError(f"Failed to list requests: {status}")
+    
+    async def iter_gitops_requests(self, page_size: int = 50) -> AsyncIterator[GitOpsStatus]:
+        """Iterate over all GitOps generation requests
+        
+        The next page is fetched while the caller works through the current one.
+        """
+        offset = 0
+        page = await self.list_gitops_requests(page_size, offset)
+        while page:
+            offset += len(page)
+            next_page = None
+            if len(page) >= page_size:
+                next_page = asyncio.create_task(self.list_gitops_requests(page_size, offset))
             
-            params = {"limit": limit, "offset": offset}
-            async with self.session.get(
-                urljoin(self.gitops_url, "/api/gitops/list"),
-                params=params
-            ) as response:
-                duration = time.time() - start_time
-                
-                if self.monitoring:
-                    self.monitoring.record_duration(
-                        "gitops_client_request_duration",
-                        {"operation": "list_requests"},
-                        duration
-                    )
-                
-                if response.status == 200:
-                    data = await response.json()
-                    
-                    # Convert data to GitOpsStatus objects
-                    requests = []
-                    for item in data:
-                        if 'start_time' in item:
-                            item['start_time'] = datetime.fromisoformat(item['start_time'].replace('Z', '+00:00'))
-                        if 'end_time' in item and item['end_time']:
-                            item['end_time'] = datetime.fromisoformat(item['end_time'].replace('Z', '+00:00'))
-                        requests.append(GitOpsStatus(**item))
-                    
-                    if self.monitoring:
-                        self.monitoring.inc_counter(
-                            "gitops_client_requests",
-                            {"operation": "list_requests", "status": "success"}
-                        )
-                    
-                    return requests
-                else:
-                    if self.monitoring:
-                        self.monitoring.inc_counter(
-                            "gitops_client_requests",
-                            {"operation": "list_requests", "status": "failed"}
-                        )
-                    raise Exception(f"Failed to list requests: {response.status}")
-                    
-        except Exception as e:
-            if self.monitoring:
-                self.monitoring.inc_counter(
-                    "gitops_client_requests",
-                    {"operation": "list_requests", "status": "error"}
-                )
-            raise Exception(f"Failed to list GitOps requests: {e}")
+            try:
+                for item in page:
+                    yield item
+            except BaseException:
+                # The caller stopped early or failed; drop the prefetch
+                if next_page is not None:
+                    next_page.cancel()
+                raise
+            
+            if next_page is None:
+                break
+            page = await next_page
     
     async def wait_for_completion(self, request_id: str, timeout: int = 600) -> GitOpsStatus:
-        """Wait for GitOps generation to complete"""
-        start_time = time.time()
+        """Wait for GitOps generation to complete
+        
+        Polls with exponential backoff, starting at POLL_INITIAL_DELAY and capped
+        at POLL_MAX_DELAY, so short jobs are noticed quickly without hammering
+        the status endpoint on long ones. Status lookup errors back off
+        separately and give up after MAX_CONSECUTIVE_POLL_FAILURES in a row;
+        a failed generation, an unknown request id or another 4xx client
+        error fails immediately.
+        """
+        # Bind the per-iteration lookups once; the loop runs for the whole wait
+        monotonic = time.monotonic
+        sleep = asyncio.sleep
+        get_status = self.get_gitops_status
         
-        while time.time() - start_time < timeout:
+        start_time = monotonic()
+        deadline = start_time + timeout
+        delay = POLL_INITIAL_DELAY
+        consecutive_failures = 0
+        
+        while monotonic() < deadline:
             try:
-                status = await self.get_gitops_status(request_id)
-                
-                if status.status == "completed":
-                    if self.monitoring:
-                        self.monitoring.inc_counter(
-                            "gitops_client_completions",
-                            {"status": "success"}
-                        )
-                    return status
-                elif status.status == "failed":
-                    if self.monitoring:
-                        self.monitoring.inc_counter(
-                            "gitops_client_completions",
-                            {"status": "failure"}
-                        )
-                    raise Exception(f"GitOps generation failed: {status.error_message}")
-                elif status.status in ["running", "pending"]:
-                    # Continue waiting
-                    await asyncio.sleep(5)
-                    continue
-                else:
-                    raise Exception(f"Unknown GitOps status: {status.status}")
-                    
+                # Never let a slow status call run past the caller's deadline
+                status = await get_status(request_id, timeout=deadline - monotonic())
+                if status.status not in ("completed", "failed", "running", "pending"):
+                    raise GitOpsClientError(f"Unknown GitOps status: {status.status}")
+            except GitOpsRequestError:
+                # Unknown ids and rejected lookups will not start succeeding
+                raise
             except Exception as e:
+                consecutive_failures += 1
+                if consecutive_failures >= MAX_CONSECUTIVE_POLL_FAILURES:
+                    raise GitOpsClientError(f"Giving up on GitOps request {request_id} after "
+                                    f"{consecutive_failures} consecutive errors: {e}")
                 logger.error(f"Error while waiting for completion: {e}")
-                await asyncio.sleep(5)
+                error_delay = min(POLL_ERROR_MAX_DELAY, 0.5 * 2 ** consecutive_failures)
+                await sleep(min(error_delay, max(deadline - monotonic(), 0)))
+                continue
+            
+            consecutive_failures = 0
+            
+            if status.status == "completed":
+                self._count("gitops_client_completions", _STATUS_LABELS["success"])
+                return status
+            elif status.status == "failed":
+                self._count("gitops_client_completions", _STATUS_LABELS["failure"])
+                raise GitOpsClientError(f"GitOps generation failed: {status.error_message}")
+            
+            # Still running or pending
+            await sleep(min(delay, max(deadline - monotonic(), 0)))
+            delay = min(delay * 2, POLL_MAX_DELAY)
         
-        raise Exception(f"GitOps generation timed out after {timeout} seconds")
+        raise GitOpsClientError(f"GitOps generation timed out after {timeout} seconds")
     
     async def cancel_gitops_generation(self, request_id: str) -> bool:
         """Cancel GitOps generation"""
         try:
-            start_time = time.time()
-            
-            async with self.session.post(
-                urljoin(self.gitops_url, f"/api/gitops/cancel/{request_id}")
-            ) as response:
-                duration = time.time() - start_time
-                
-                if self.monitoring:
-                    self.monitoring.record_duration(
-                        "gitops_client_request_duration",
-                        {"operation": "cancel_generation"},
-                        duration
-                    )
-                
-                if response.status == 200:
-                    if self.monitoring:
-                        self.monitoring.inc_counter(
-                            "gitops_client_requests",
-                            {"operation": "cancel_generation", "status": "success"}
-                        )
-                    return True
-                else:
-                    if self.monitoring:
-                        self.monitoring.inc_counter(
-                            "gitops_client_requests",
-                            {"operation": "cancel_generation", "status": "failed"}
-                        )
-                    return False
+            status, _ = await self._request(
+                "POST", self._url_cancel + request_id, "cancel_generation"
+            )
+            if status == 200:
+                self._count_request("cancel_generation", "success")
+                return True
+            else:
+                self._count_request("cancel_generation", "failed")
+                return False
                     
         except Exception as e:
-            if self.monitoring:
-                self.monitoring.inc_counter(
-                    "gitops_client_requests",
-                    {"operation": "cancel_generation", "status": "error"}
-                )
+            self._count_request("cancel_generation", "error")
             logger.error(f"Failed to cancel GitOps generation: {e}")
             return False
     
     async def notify_completion(self, status: GitOpsStatus) -> bool:
-        """Notify integration bridge of GitOps completion"""
-        try:
-            webhook_request = {
-                "id": f"gitops-completion-{status.request_id}",
-                "type": "gitops_completed",
-                "source": "gitops-generator",
-                "timestamp": datetime.utcnow().isoformat(),
-                "data": {
-                    "request_id": status.request_id,
-                    "status": status.status,
-                    "files_generated": status.files_generated,
-                    "files_committed": status.files_committed,
-                    "git_commit_hash": status.git_commit_hash,
-                    "error": status.error_message,
-                    "duration_seconds": status.duration.total_seconds() if status.duration else None
-                }
+        """Notify integration bridge of GitOps completion
+        
+        Notifications made close together are sent to the bridge in one batch;
+        returns whether this one was delivered.
+        """
+        # The timestamp and duration are encoded by _json_default (ISO 8601
+        # string and seconds, respectively) as the body is serialized
+        webhook_request = {
+            "id": f"gitops-completion-{status.request_id}",
+            "type": "gitops_completed",
+            "source": "gitops-generator",
+            "timestamp": datetime.utcnow(),
+            "data": {
+                "request_id": status.request_id,
+                "status": status.status,
+                "files_generated": status.files_generated,
+                "files_committed": status.files_committed,
+                "git_commit_hash": status.git_commit_hash,
+                "error": status.error_message,
+                "duration_seconds": status.duration
             }
+        }
+        
+        if self._notify_task is None:
+            self._notify_queue = asyncio.Queue(NOTIFY_QUEUE_SIZE)
+            self._notify_task = asyncio.create_task(self._notify_flusher())
+        
+        delivered = asyncio.get_running_loop().create_future()
+        await self._notify_queue.put((webhook_request, delivered))
+        return await delivered
+    
+    async def _notify_flusher(self):
+        """Send queued completion notifications in batches until cancelled"""
+        queue = self._notify_queue
+        while True:
+            batch = [await queue.get()]
+            # Give notifications arriving right behind this one a chance to join it
+            if queue.qsize() < NOTIFY_BATCH_SIZE - 1:
+                await asyncio.sleep(NOTIFY_BATCH_WINDOW)
+            while len(batch) < NOTIFY_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+            
+            try:
+                results = await self._send_notifications([webhook_request for webhook_request, _ in batch])
+            except Exception as e:
+                # Callers must never be left waiting, nor close() on queue.join()
+                logger.error(f"Failed to send completion notifications: {e}")
+                results = [False] * len(batch)
+            for (_, delivered), result in zip(batch, results):
+                if not delivered.done():
+                    delivered.set_result(result)
+                queue.task_done()
+    
+    async def _send_notifications(self, webhook_requests: List[Dict[str, Any]]) -> List[bool]:
+        """Post completion notifications, batched when the bridge supports it"""
+        if len(webhook_requests) > 1 and self._notify_batch_supported:
+            try:
+                status_code, payload = await self._request(
+                    "POST", self._url_completed_batch,
+                    data=_json_dumps(webhook_requests), headers=_JSON_HEADERS
+                )
+            except Exception as e:
+                for _ in webhook_requests:
+                    self._count("gitops_client_notifications", _COMPLETION_NOTIFICATION_LABELS["error"])
+                logger.error(f"Failed to notify completion: {e}")
+                return [False] * len(webhook_requests)
             
-            async with self.session.post(
-                urljoin(self.bridge_url, "/webhooks/gitops/completed"),
-                json=webhook_request
-            ) as response:
-                if response.status == 200:
-                    if self.monitoring:
-                        self.monitoring.inc_counter(
-                            "gitops_client_notifications",
-                            {"type": "completion", "status": "success"}
-                        )
-                    return True
+            if status_code != 404:
+                if status_code == 200:
+                    delivered = _batch_results(payload, len(webhook_requests))
                 else:
-                    if self.monitoring:
-                        self.monitoring.inc_counter(
-                            "gitops_client_notifications",
-                            {"type": "completion", "status": "failed"}
-                        )
-                    logger.error(f"Completion notification failed: {response.status}")
-                    return False
+                    logger.error(f"Completion notification failed: {status_code}")
+                    delivered = [False] * len(webhook_requests)
+                for ok in delivered:
+                    self._count("gitops_client_notifications",
+                                _COMPLETION_NOTIFICATION_LABELS["success" if ok else "failed"])
+                return delivered
+            
+            # The bridge predates the batch endpoint; post each notification on its own
+            self._notify_batch_supported = False
+        
+        return list(await asyncio.gather(*map(self._post_completion, webhook_requests)))
+    
+    async def _post_completion(self, webhook_request: Dict[str, Any]) -> bool:
+        """Post a single completion notification"""
+        try:
+            status_code, _ = await self._request(
+                "POST", self._url_completed,
+                data=_json_dumps(webhook_request), headers=_JSON_HEADERS
+            )
+            if status_code == 200:
+                self._count("gitops_client_notifications", _COMPLETION_NOTIFICATION_LABELS["success"])
+                return True
+            else:
+                self._count("gitops_client_notifications", _COMPLETION_NOTIFICATION_LABELS["failed"])
+                logger.error(f"Completion notification failed: {status_code}")
+                return False
                     
         except Exception as e:
-            if self.monitoring:
-                self.monitoring.inc_counter(
-                    "gitops_client_notifications",
-                    {"type": "completion", "status": "error"}
-                )
+            self._count("gitops_client_notifications", _COMPLETION_NOTIFICATION_LABELS["error"])
             logger.error(f"Failed to notify completion: {e}")
             return False
     
     async def get_health_status(self) -> Dict[str, Any]:
         """Get health status of GitOps service"""
         try:
-            async with self.session.get(
-                urljoin(self.gitops_url, "/health")
-            ) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    raise Exception(f"Health check failed: {response.status}")
-                    
-        except Exception as e:
-            raise Exception(f"Failed to get health status: {e}")
+            status, health = await self._conditional_get(self._url_health, _json_loads)
+        except _TRANSPORT_ERRORS as e:
+            raise GitOpsClientError(f"Failed to get health status: {e}") from e
+        
+        if status == 200:
+            # May be the cached copy, nested values included
+            return copy.deepcopy(health)
+        else:
+            raise GitOpsClientError(f"Health check failed: {status}")
     
     def create_request_from_backup(self, backup_event: Dict[str, Any], config_override: Optional[Dict[str, Any]] = None) -> GitOpsRequest:
         """Create GitOps request from backup completion event"""
@@ -472,9 +816,14 @@ class GitOpsClient:
 
 # Convenience functions for common operations
 
-async def process_backup_completion(config: Dict[str, Any], backup_event: Dict[str, Any], monitoring_client=None) -> GitOpsStatus:
-    """Process backup completion and generate GitOps artifacts"""
-    async with GitOpsClient(config, monitoring_client) as client:
+async def process_backup_completion(config: Dict[str, Any], backup_event: Dict[str, Any], monitoring_client=None,
+                                    session: Optional[aiohttp.ClientSession] = None) -> GitOpsStatus:
+    """Process backup completion and generate GitOps artifacts
+    
+    Pass session (e.g. get_shared_session()) to reuse pooled connections
+    across calls; otherwise a session is opened and closed for this call.
+    """
+    async with GitOpsClient(config, monitoring_client, session) as client:
         # Create GitOps request from backup event
         request = client.create_request_from_backup(backup_event)
         
@@ -491,21 +840,20 @@ async def process_backup_completion(config: Dict[str, Any], backup_event: Dict[s
         return status
 
 
-async def get_integration_status(config: Dict[str, Any]) -> Dict[str, Any]:
+async def get_integration_status(config: Dict[str, Any],
+                                 session: Optional[aiohttp.ClientSession] = None) -> Dict[str, Any]:
     """Get overall integration status"""
-    async with GitOpsClient(config) as client:
+    async with GitOpsClient(config, session=session) as client:
         try:
             gitops_health = await client.get_health_status()
             
             # Try to get bridge status
             try:
-                async with client.session.get(
-                    urljoin(client.bridge_url, "/status")
-                ) as response:
-                    if response.status == 200:
-                        bridge_status = await response.json()
-                    else:
-                        bridge_status = {"error": f"Bridge unreachable: {response.status}"}
+                status, payload = await client._request("GET", client._url_bridge_status)
+                if status == 200:
+                    bridge_status = _json_loads(payload)
+                else:
+                    bridge_status = {"error": f"Bridge unreachable: {status}"}
             except Exception as e:
                 bridge_status = {"error": f"Bridge unreachable: {e}"}
             
@@ -524,8 +872,6 @@ async def get_integration_status(config: Dict[str, Any]) -> Dict[str, Any]:
 
 if __name__ == "__main__":
     # Example usage
-    import sys
-    
     async def main():
         # Load configuration
         config = {
@@ -544,8 +890,11 @@ if __name__ == "__main__":
         }
         
         # Test integration
-        status = await get_integration_status(config)
-        print(json.dumps(status, indent=2))
+        try:
+            status = await get_integration_status(config, get_shared_session())
+            print(json.dumps(status, indent=2))
+        finally:
+            await close_shared_session()
     
     if len(sys.argv) > 1 and sys.argv[1] == "test":
         asyncio.run(main())
\ No newline at end of file
@@ -415,6 +415,80 @@ func TestWebhookHandler(t *testing.T) {
 			t.Errorf("Expected registration to succeed, got: %s", response.Message)
 		}
 	})
+
+	t.Run("GitOpsCompletedBatch", func(t *testing.T) {
+		// Fail delivery of one notification so the batch partially succeeds
+		bridge.eventBus.Subscribe("gitops_completed", func(ctx context.Context, event *IntegrationEvent) error {
+			if event.ID == "batch-2" {
+				return fmt.Errorf("subscriber rejected %s", event.ID)
+			}
+			return nil
+		})
+
+		var batch []map[string]interface{}
+		for i := 1; i <= 3; i++ {
+			batch = append(batch, map[string]interface{}{
+				"id":        fmt.Sprintf("batch-%d", i),
+				"type":      "gitops_completed",
+				"source":    "gitops-generator",
+				"timestamp": time.Now(),
+				"data":      map[string]interface{}{"request_id": fmt.Sprintf("req-%d", i), "status": "completed"},
+			})
+		}
+
+		requestBody, err := json.Marshal(batch)
+		if err != nil {
+			t.Fatalf("Failed to marshal request: %v", err)
+		}
+
+		resp, err := http.Post(
+			server.URL+"/webhooks/gitops/completed_batch",
+			"application/json",
+			strings.NewReader(string(requestBody)),
+		)
+		if err != nil {
+			t.Fatalf("Failed to call batch webhook: %v", err)
+		}
+		defer resp.Body.Close()
+
+		if resp.StatusCode != http.StatusOK {
+			t.Errorf("Expected status 200, got %d", resp.StatusCode)
+		}
+
+		var response struct {
+			Success bool `json:"success"`
+			Data    struct {
+				Processed int                `json:"processed"`
+				Failed    int                `json:"failed"`
+				Results   []BatchEntryResult `json:"results"`
+			} `json:"data"`
+		}
+		if err := json.NewDecoder(resp.Body).Decode(&response); err != nil {
+			t.Fatalf("Failed to decode response: %v", err)
+		}
+
+		if response.Success {
+			t.Error("Expected batch with a failed entry to report failure")
+		}
+		if response.Data.Processed != 2 || response.Data.Failed != 1 {
+			t.Errorf("Expected 2 processed and 1 failed, got %d and %d", response.Data.Processed, response.Data.Failed)
+		}
+		if len(response.Data.Results) != 3 {
+			t.Fatalf("Expected 3 results, got %d", len(response.Data.Results))
+		}
+		for i, result := range response.Data.Results {
+			expectedID := fmt.Sprintf("batch-%d", i+1)
+			if result.ID != expectedID {
+				t.Errorf("Expected result %d for %s, got %s", i, expectedID, result.ID)
+			}
+			if result.Success != (result.ID != "batch-2") {
+				t.Errorf("Unexpected outcome for %s: success=%v error=%q", result.ID, result.Success, result.Error)
+			}
+		}
+		if response.Data.Results[1].Error == "" {
+			t.Error("Expected an error message for the failed entry")
+		}
+	})
 }
 
 // TestBackupToGitOpsFlow tests the complete backup-to-GitOps integration flow
@@ -7,15 +7,24 @@ providing authentication, encryption, input validation, and audit logging.
 """
 
 import asyncio
+import copy
+import functools
 import json
 import logging
 import time
-from dataclasses import dataclass, asdict
+from contextvars import ContextVar
+from dataclasses import dataclass, is_dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Tuple, Union
 from urllib.parse import urljoin
 
 import aiohttp
+from aiohttp import web
+
+try:
+    import orjson
+except ImportError:  # optional accelerator, stdlib json is used otherwise
+    orjson = None
 
 # Import the security framework
 from security.python_security import (
@@ -26,8 +35,68 @@ from security.python_security import (
 
 logger = logging.getLogger(__name__)
 
+# Security events waiting for the background audit writer, and how many it
+# writes per wakeup; producers wait when the queue is full, nothing is dropped
+AUDIT_QUEUE_SIZE = 10000
+AUDIT_BATCH_SIZE = 64
+
+# Monitoring label sets, built once and shared by every call; monitoring
+# clients receive them read-only
+_OPERATIONS = ("start_generation", "get_status")
+_OUTCOMES = ("success", "failure", "failed", "not_found", "security_error", "error")
+_OPERATION_LABELS = {op: {"operation": op} for op in _OPERATIONS}
+_REQUEST_LABELS = {(op, st): {"operation": op, "status": st} for op in _OPERATIONS for st in _OUTCOMES}
+_STATUS_LABELS = {st: {"status": st} for st in _OUTCOMES}
+_COMPLETION_NOTIFICATION_LABELS = {st: {"type": "completion", "status": st} for st in _OUTCOMES}
+
+# Monitoring client of the call in progress. Shared clients serve callers
+# with different monitoring clients, so it is set per call (per task) rather
+# than on the client itself
+_call_monitoring: ContextVar[Optional[Any]] = ContextVar("secure_gitops_call_monitoring", default=None)
+
+# SecureGitOpsRequest fields that must be set before a request is sent
+_REQUIRED_REQUEST_FIELDS = ("request_id", "backup_id", "cluster_name", "source_path")
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode values the JSON encoder does not handle natively"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, timedelta):
+        return obj.total_seconds()
+    if is_dataclass(obj):
+        # Shallow field dict; nested values are encoded by the same hook, so
+        # there is no need for asdict's recursive deep copy
+        return {name: getattr(obj, name) for name in obj.__dataclass_fields__}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_json_default)
 
-@dataclass
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, default=_json_default).encode()
+
+    _json_loads = json.loads
+
+
+def _json_response(payload: Dict[str, Any], status: int = 200) -> web.Response:
+    """Encode payload with the module's JSON encoder into a response"""
+    return web.Response(body=_json_dumps(payload), status=status, content_type="application/json")
+
+
+# Responses within the same second share one formatted timestamp; audit
+# events keep full precision and do not use this
+@functools.lru_cache(maxsize=4)
+def _iso_ts(sec: int) -> str:
+    """UTC ISO-8601 timestamp for a whole second"""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+
+
+@dataclass(slots=True)
 class SecureGitOpsRequest:
     """Secure GitOps generation request with authentication context"""
     request_id: str
@@ -48,9 +117,24 @@ class SecureGitOpsRequest:
             self.configuration = {}
         if self.security_metadata is None:
             self.security_metadata = {}
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the fields as a shallow dict; unlike asdict, values are not deep-copied"""
+        return {
+            "request_id": self.request_id,
+            "backup_id": self.backup_id,
+            "cluster_name": self.cluster_name,
+            "source_path": self.source_path,
+            "target_repo": self.target_repo,
+            "target_branch": self.target_branch,
+            "configuration": self.configuration,
+            "timestamp": self.timestamp,
+            "auth_context": self.auth_context,
+            "security_metadata": self.security_metadata
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class SecureGitOpsResponse:
     """Secure GitOps generation response with security context"""
     request_id: str
@@ -61,14 +145,29 @@ class SecureGitOpsResponse:
     progress: Optional[Dict[str, Any]] = None
     metadata: Optional[Dict[str, Any]] = None
     security_context: Optional[Dict[str, Any]] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the fields as a shallow dict; unlike asdict, values are not deep-copied"""
+        return {
+            "request_id": self.request_id,
+            "status": self.status,
+            "message": self.message,
+            "start_time": self.start_time,
+            "estimated_time": self.estimated_time,
+            "progress": self.progress,
+            "metadata": self.metadata,
+            "security_context": self.security_context
+        }
 
 
 class SecureGitOpsClient:
     """Secure GitOps client with comprehensive security integration"""
     
-    def __init__(self, config: Dict[str, Any], monitoring_client=None):
+    def __init__(self, config: Dict[str, Any], monitoring_client=None, preconnect: bool = False):
         self.config = config
         self.monitoring = monitoring_client
+        # Open connections to the endpoints while authenticating on entry
+        self.preconnect = preconnect
         
         # Initialize security manager
         self.security_config = create_security_config_from_dict(config)
@@ -81,36 +180,94 @@ class SecureGitOpsClient:
         self.gitops_url = endpoints.get('gitops_generator', 'https://localhost:8443')
         self.bridge_url = endpoints.get('integration_bridge', 'https://localhost:8443')
         
+        # Endpoint URLs are fixed for the client's lifetime; join them once.
+        # Request ids are appended to the status prefix.
+        self._url_generate = urljoin(self.gitops_url, "/api/gitops/generate")
+        self._url_status = urljoin(self.gitops_url, "/api/gitops/status/")
+        self._url_health = urljoin(self.gitops_url, "/health")
+        self._url_register = urljoin(self.bridge_url, "/register/gitops")
+        self._url_completed = urljoin(self.bridge_url, "/webhooks/gitops/completed")
+        self._url_bridge_status = urljoin(self.bridge_url, "/status")
+        
         # Session will be created with security configuration
         self.session = None
         self.auth_context = None
         
+        # Static per-client values, built once: the authentication headers and,
+        # after authentication, the security context sent with notifications
+        self._api_key_headers = {"X-API-Key": self.security_config.api_key} if self.security_config.api_key else {}
+        self._security_context: Optional[Dict[str, Any]] = None
+        
+        # Status lookups in flight, by request id, so concurrent callers share one
+        self._status_inflight: Dict[str, asyncio.Future] = {}
+        
+        # Security score, computed on first use after each authentication
+        self._security_score: Optional[float] = None
+        
+        # Background audit writer, running while the client is entered
+        self._audit_queue: Optional[asyncio.Queue] = None
+        self._audit_task: Optional[asyncio.Task] = None
+        
+        # Request signing, if a secret key is configured. Signed bodies carry
+        # per-call timestamps, so signatures are computed fresh every time
+        crypto_manager = self.security_manager.crypto_manager
+        self._sign = crypto_manager.sign_request if crypto_manager else None
+        
         logger.info(f"Secure GitOps client initialized - GitOps: {self.gitops_url}, Bridge: {self.bridge_url}")
     
     async def __aenter__(self):
         # Create secure HTTP session
         self.session = await self.security_manager.create_secure_http_session()
         
-        # Authenticate the client
-        await self._authenticate_client()
+        # Security events are written off the request path
+        if self.security_manager.audit_logger:
+            self._audit_queue = asyncio.Queue(AUDIT_QUEUE_SIZE)
+            self._audit_task = asyncio.create_task(self._audit_writer())
+        
+        # Authenticate the client, warming up connections alongside if asked to
+        try:
+            if self.preconnect:
+                await asyncio.gather(
+                    self._authenticate_client(),
+                    *(self._prewarm(url) for url in dict.fromkeys((self.gitops_url, self.bridge_url)))
+                )
+            else:
+                await self._authenticate_client()
+        except BaseException:
+            # __aexit__ is not called when entering fails; stop the audit
+            # writer and close the session here instead
+            await self.__aexit__(None, None, None)
+            raise
         
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._audit_task is not None:
+            # Write out queued security events before stopping the writer
+            await self._audit_queue.join()
+            self._audit_task.cancel()
+            try:
+                await self._audit_task
+            except asyncio.CancelledError:
+                pass
+            self._audit_task = None
         if self.session:
             await self.session.close()
     
     async def _authenticate_client(self):
         """Authenticate the client with the security framework"""
         try:
-            headers = {}
-            if self.security_config.api_key:
-                headers["X-API-Key"] = self.security_config.api_key
-            
             self.auth_context = await self.security_manager.authenticate_request(
-                headers, 
+                self._api_key_headers, 
                 source_ip="127.0.0.1"  # Client-side authentication
             )
+            self._security_score = None
+            self._security_context = {
+                "authenticated": True,
+                "client_id": self.auth_context.client_id,
+                "auth_method": self.auth_context.auth_method,
+                "security_level": "high"
+            }
             
             logger.info(f"Client authenticated successfully: {self.auth_context.client_id}")
             
@@ -118,6 +275,49 @@ class SecureGitOpsClient:
             logger.error(f"Client authentication failed: {e}")
             raise
     
+    def _monitor(self):
+        """Monitoring client for the current call, falling back to the client's own"""
+        monitoring = _call_monitoring.get()
+        return self.monitoring if monitoring is None else monitoring
+    
+    def _count(self, metric: str, labels: Dict[str, str]):
+        """Increment a monitoring counter, if monitoring is enabled"""
+        monitoring = self._monitor()
+        if monitoring:
+            monitoring.inc_counter(metric, labels)
+    
+    def _count_request(self, operation: str, status: str):
+        """Count a secure GitOps API request outcome"""
+        monitoring = self._monitor()
+        if monitoring:
+            monitoring.inc_counter("secure_gitops_client_requests", _REQUEST_LABELS[operation, status])
+    
+    def _record_duration(self, operation: str, duration: float):
+        """Record the duration of a secure GitOps API request"""
+        monitoring = self._monitor()
+        if monitoring:
+            monitoring.record_duration("secure_gitops_client_request_duration", _OPERATION_LABELS[operation], duration)
+    
+    async def _prewarm(self, base_url: str):
+        """Open a pooled connection to base_url ahead of the first real request"""
+        try:
+            async with self.session.head(urljoin(base_url, "/health")):
+                pass
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.debug(f"Could not pre-connect to {base_url}: {e}")
+    
+    async def register_and_start(self, request: SecureGitOpsRequest,
+                                 version: str = "2.1.0") -> Tuple[bool, SecureGitOpsResponse]:
+        """Register with the bridge and start a generation concurrently
+        
+        For callers whose generation does not depend on the registration's outcome.
+        """
+        registered, response = await asyncio.gather(
+            self.register_with_bridge(version),
+            self.start_secure_gitops_generation(request)
+        )
+        return registered, response
+    
     async def register_with_bridge(self, version: str = "2.1.0") -> bool:
         """Register this secure GitOps client with the integration bridge"""
         try:
@@ -134,22 +334,21 @@ class SecureGitOpsClient:
             }
             
             # Sign the request for integrity
-            if self.security_manager.crypto_manager:
-                signature = self.security_manager.crypto_manager.sign_request(
-                    "POST", "/register/gitops", json.dumps(registration_data)
+            if self._sign is not None:
+                signature = self._sign(
+                    "POST", "/register/gitops", _json_dumps(registration_data).decode()
                 )
                 registration_data["signature"] = signature
             
             async with secure_http_request(
                 self.session, "POST", 
-                urljoin(self.bridge_url, "/register/gitops"),
+                self._url_register,
                 self.security_manager,
-                json=registration_data
+                data=_json_dumps(registration_data)
             ) as response:
                 if response.status == 200:
                     logger.info("Successfully registered with integration bridge")
-                    if self.monitoring:
-                        self.monitoring.inc_counter("secure_gitops_client_registrations", {"status": "success"})
+                    self._count("secure_gitops_client_registrations", _STATUS_LABELS["success"])
                     
                     # Log security event
                     await self._log_security_event(
@@ -162,8 +361,7 @@ class SecureGitOpsClient:
                 else:
                     error_text = await response.text()
                     logger.error(f"Registration failed with status: {response.status} - {error_text}")
-                    if self.monitoring:
-                        self.monitoring.inc_counter("secure_gitops_client_registrations", {"status": "failure"})
+                    self._count("secure_gitops_client_registrations", _STATUS_LABELS["failure"])
                     
                     await self._log_security_event(
                         "client_registration_failed",
@@ -175,13 +373,11 @@ class SecureGitOpsClient:
                     
         except SecurityError as e:
             logger.error(f"Security error during registration: {e}")
-            if self.monitoring:
-                self.monitoring.inc_counter("secure_gitops_client_registrations", {"status": "security_error"})
+            self._count("secure_gitops_client_registrations", _STATUS_LABELS["security_error"])
             raise
         except Exception as e:
             logger.error(f"Failed to register with bridge: {e}")
-            if self.monitoring:
-                self.monitoring.inc_counter("secure_gitops_client_registrations", {"status": "error"})
+            self._count("secure_gitops_client_registrations", _STATUS_LABELS["error"])
             raise
     
     async def start_secure_gitops_generation(self, request: SecureGitOpsRequest) -> SecureGitOpsResponse:
@@ -204,37 +400,34 @@ class SecureGitOpsClient:
                 "security_level": "high"
             }
             
-            # Validate request data
-            await self._validate_gitops_request(request)
-            
-            # Prepare secure request data
-            request_data = asdict(request)
+            # Prepare secure request data, encoded once for validation and signing
+            request_data = request.to_dict()
             request_data["timestamp"] = request.timestamp.isoformat() if request.timestamp else None
+            body = _json_dumps(request_data)
+            
+            # Validate request data
+            await self._validate_gitops_request(request, body)
             
             # Sign the request
-            if self.security_manager.crypto_manager:
-                signature = self.security_manager.crypto_manager.sign_request(
-                    "POST", "/api/gitops/generate", json.dumps(request_data)
+            if self._sign is not None:
+                signature = self._sign(
+                    "POST", "/api/gitops/generate", body.decode()
                 )
                 request_data["signature"] = signature
+                body = _json_dumps(request_data)
             
             async with secure_http_request(
                 self.session, "POST",
-                urljoin(self.gitops_url, "/api/gitops/generate"),
+                self._url_generate,
                 self.security_manager,
-                json=request_data
+                data=body
             ) as response:
                 duration = time.time() - start_time
                 
-                if self.monitoring:
-                    self.monitoring.record_duration(
-                        "secure_gitops_client_request_duration",
-                        {"operation": "start_generation"},
-                        duration
-                    )
+                self._record_duration("start_generation", duration)
                 
                 if response.status == 200:
-                    data = await response.json()
+                    data = _json_loads(await response.read())
                     
                     # Add security context to response
                     data["security_context"] = {
@@ -245,11 +438,7 @@ class SecureGitOpsClient:
                     
                     gitops_response = SecureGitOpsResponse(**data)
                     
-                    if self.monitoring:
-                        self.monitoring.inc_counter(
-                            "secure_gitops_client_requests",
-                            {"operation": "start_generation", "status": "success"}
-                        )
+                    self._count_request("start_generation", "success")
                     
                     # Log security event
                     await self._log_security_event(
@@ -261,11 +450,7 @@ class SecureGitOpsClient:
                     return gitops_response
                 else:
                     error_text = await response.text()
-                    if self.monitoring:
-                        self.monitoring.inc_counter(
-                            "secure_gitops_client_requests",
-                            {"operation": "start_generation", "status": "failed"}
-                        )
+                    self._count_request("start_generation", "failed")
                     
                     await self._log_security_event(
                         "gitops_generation_failed",
@@ -276,22 +461,29 @@ class SecureGitOpsClient:
                     raise SecurityError(f"GitOps generation failed: {response.status} - {error_text}")
                     
         except SecurityError as e:
-            if self.monitoring:
-                self.monitoring.inc_counter(
-                    "secure_gitops_client_requests",
-                    {"operation": "start_generation", "status": "security_error"}
-                )
+            self._count_request("start_generation", "security_error")
             raise
         except Exception as e:
-            if self.monitoring:
-                self.monitoring.inc_counter(
-                    "secure_gitops_client_requests",
-                    {"operation": "start_generation", "status": "error"}
-                )
+            self._count_request("start_generation", "error")
             raise SecurityError(f"Failed to start secure GitOps generation: {e}")
     
     async def get_secure_gitops_status(self, request_id: str) -> Dict[str, Any]:
-        """Get status of GitOps generation with security validation"""
+        """Get status of GitOps generation with security validation
+        
+        Concurrent lookups of the same request id share one status request.
+        """
+        lookup = self._status_inflight.get(request_id)
+        if lookup is None:
+            lookup = asyncio.ensure_future(self._fetch_secure_gitops_status(request_id))
+            self._status_inflight[request_id] = lookup
+            lookup.add_done_callback(lambda _: self._status_inflight.pop(request_id, None))
+        
+        # Shielded so a cancelled caller does not cancel the lookup for the others;
+        # each caller gets its own deep copy, nested values included
+        return copy.deepcopy(await asyncio.shield(lookup))
+    
+    async def _fetch_secure_gitops_status(self, request_id: str) -> Dict[str, Any]:
+        """Request the status of a GitOps generation"""
         try:
             # Validate authentication
             if not self.auth_context or not self.auth_context.authenticated:
@@ -303,20 +495,15 @@ class SecureGitOpsClient:
             
             async with secure_http_request(
                 self.session, "GET",
-                urljoin(self.gitops_url, f"/api/gitops/status/{request_id}"),
+                self._url_status + request_id,
                 self.security_manager
             ) as response:
                 duration = time.time() - start_time
                 
-                if self.monitoring:
-                    self.monitoring.record_duration(
-                        "secure_gitops_client_request_duration",
-                        {"operation": "get_status"},
-                        duration
-                    )
+                self._record_duration("get_status", duration)
                 
                 if response.status == 200:
-                    data = await response.json()
+                    data = _json_loads(await response.read())
                     
                     # Add security context
                     data["security_context"] = {
@@ -325,41 +512,21 @@ class SecureGitOpsClient:
                         "access_time": datetime.utcnow().isoformat()
                     }
                     
-                    if self.monitoring:
-                        self.monitoring.inc_counter(
-                            "secure_gitops_client_requests",
-                            {"operation": "get_status", "status": "success"}
-                        )
+                    self._count_request("get_status", "success")
                     
                     return data
                 elif response.status == 404:
-                    if self.monitoring:
-                        self.monitoring.inc_counter(
-                            "secure_gitops_client_requests",
-                            {"operation": "get_status", "status": "not_found"}
-                        )
+                    self._count_request("get_status", "not_found")
                     raise SecurityError(f"GitOps request not found: {request_id}")
                 else:
-                    if self.monitoring:
-                        self.monitoring.inc_counter(
-                            "secure_gitops_client_requests",
-                            {"operation": "get_status", "status": "failed"}
-                        )
+                    self._count_request("get_status", "failed")
                     raise SecurityError(f"Failed to get status: {response.status}")
                     
         except SecurityError as e:
-            if self.monitoring:
-                self.monitoring.inc_counter(
-                    "secure_gitops_client_requests",
-                    {"operation": "get_status", "status": "security_error"}
-                )
+            self._count_request("get_status", "security_error")
             raise
         except Exception as e:
-            if self.monitoring:
-                self.monitoring.inc_counter(
-                    "secure_gitops_client_requests",
-                    {"operation": "get_status", "status": "error"}
-                )
+            self._count_request("get_status", "error")
             raise SecurityError(f"Failed to get secure GitOps status: {e}")
     
     async def notify_secure_completion(self, status_data: Dict[str, Any]) -> bool:
@@ -375,33 +542,24 @@ class SecureGitOpsClient:
                 "source": "secure-gitops-generator",
                 "timestamp": datetime.utcnow().isoformat(),
                 "data": status_data,
-                "security_context": {
-                    "authenticated": True,
-                    "client_id": self.auth_context.client_id,
-                    "auth_method": self.auth_context.auth_method,
-                    "security_level": "high"
-                }
+                "security_context": self._security_context
             }
             
             # Sign the notification
-            if self.security_manager.crypto_manager:
-                signature = self.security_manager.crypto_manager.sign_request(
-                    "POST", "/webhooks/gitops/completed", json.dumps(webhook_request)
+            if self._sign is not None:
+                signature = self._sign(
+                    "POST", "/webhooks/gitops/completed", _json_dumps(webhook_request).decode()
                 )
                 webhook_request["signature"] = signature
             
             async with secure_http_request(
                 self.session, "POST",
-                urljoin(self.bridge_url, "/webhooks/gitops/completed"),
+                self._url_completed,
                 self.security_manager,
-                json=webhook_request
+                data=_json_dumps(webhook_request)
             ) as response:
                 if response.status == 200:
-                    if self.monitoring:
-                        self.monitoring.inc_counter(
-                            "secure_gitops_client_notifications",
-                            {"type": "completion", "status": "success"}
-                        )
+                    self._count("secure_gitops_client_notifications", _COMPLETION_NOTIFICATION_LABELS["success"])
                     
                     await self._log_security_event(
                         "completion_notification_sent",
@@ -411,11 +569,7 @@ class SecureGitOpsClient:
                     
                     return True
                 else:
-                    if self.monitoring:
-                        self.monitoring.inc_counter(
-                            "secure_gitops_client_notifications",
-                            {"type": "completion", "status": "failed"}
-                        )
+                    self._count("secure_gitops_client_notifications", _COMPLETION_NOTIFICATION_LABELS["failed"])
                     
                     error_text = await response.text()
                     await self._log_security_event(
@@ -428,19 +582,11 @@ class SecureGitOpsClient:
                     return False
                     
         except SecurityError as e:
-            if self.monitoring:
-                self.monitoring.inc_counter(
-                    "secure_gitops_client_notifications",
-                    {"type": "completion", "status": "security_error"}
-                )
+            self._count("secure_gitops_client_notifications", _COMPLETION_NOTIFICATION_LABELS["security_error"])
             logger.error(f"Security error in completion notification: {e}")
             raise
         except Exception as e:
-            if self.monitoring:
-                self.monitoring.inc_counter(
-                    "secure_gitops_client_notifications",
-                    {"type": "completion", "status": "error"}
-                )
+            self._count("secure_gitops_client_notifications", _COMPLETION_NOTIFICATION_LABELS["error"])
             logger.error(f"Failed to send secure completion notification: {e}")
             return False
     
@@ -449,11 +595,11 @@ class SecureGitOpsClient:
         try:
             async with secure_http_request(
                 self.session, "GET",
-                urljoin(self.gitops_url, "/health"),
+                self._url_health,
                 self.security_manager
             ) as response:
                 if response.status == 200:
-                    health_data = await response.json()
+                    health_data = _json_loads(await response.read())
                     
                     # Add security status
                     health_data["security"] = {
@@ -461,7 +607,7 @@ class SecureGitOpsClient:
                         "tls_enabled": self.security_config.tls_enabled,
                         "audit_enabled": self.security_config.audit_enabled,
                         "client_authenticated": self.auth_context.authenticated if self.auth_context else False,
-                        "security_score": await self._calculate_security_score()
+                        "security_score": self._get_security_score()
                     }
                     
                     return health_data
@@ -471,28 +617,32 @@ class SecureGitOpsClient:
         except Exception as e:
             raise SecurityError(f"Failed to get secure health status: {e}")
     
-    async def _validate_gitops_request(self, request: SecureGitOpsRequest):
-        """Validate GitOps request for security issues"""
+    async def _validate_gitops_request(self, request: SecureGitOpsRequest, body: Optional[bytes] = None):
+        """Validate GitOps request for security issues
+        
+        body is the request's JSON encoding, if the caller already has it.
+        """
         # Validate required fields
-        if not request.request_id:
-            raise ValidationError("request_id is required")
-        if not request.backup_id:
-            raise ValidationError("backup_id is required")
-        if not request.cluster_name:
-            raise ValidationError("cluster_name is required")
-        if not request.source_path:
-            raise ValidationError("source_path is required")
-        
-        # Validate data using security manager
-        request_data = asdict(request)
+        for name in _REQUIRED_REQUEST_FIELDS:
+            if not getattr(request, name):
+                raise ValidationError(f"{name} is required")
+        
+        # Validate data using security manager; the request is encoded
+        # directly rather than through an asdict copy
+        if body is None:
+            body = _json_dumps(request)
         await self.security_manager.validate_request(
             "POST", "/api/gitops/generate", 
-            {}, json.dumps(request_data).encode(), 
+            {"Content-Type": "application/json"}, body, 
             self.auth_context.client_id if self.auth_context else "unknown"
         )
     
     async def _log_security_event(self, event_type: str, status: str, message: str):
-        """Log security event"""
+        """Log security event
+        
+        While the client is entered the event is queued for the background
+        audit writer; otherwise it is written directly.
+        """
         if self.security_manager.audit_logger:
             event = SecurityEvent(
                 event_type=event_type,
@@ -504,9 +654,39 @@ class SecureGitOpsClient:
                 status=status,
                 message=message
             )
-            await self.security_manager.audit_logger.log_event(event)
+            if self._audit_task is not None:
+                await self._audit_queue.put(event)
+            else:
+                await self.security_manager.audit_logger.log_event(event)
+    
+    async def _audit_writer(self):
+        """Write queued security events, several per wakeup, until cancelled"""
+        queue = self._audit_queue
+        audit_logger = self.security_manager.audit_logger
+        while True:
+            events = [await queue.get()]
+            while len(events) < AUDIT_BATCH_SIZE and not queue.empty():
+                events.append(queue.get_nowait())
+            
+            for event in events:
+                try:
+                    await audit_logger.log_event(event)
+                except Exception as e:
+                    logger.error(f"Failed to write security event {event.event_type}: {e}")
+                finally:
+                    queue.task_done()
+    
+    def _get_security_score(self) -> float:
+        """Return the client's security score
+        
+        It only depends on configuration and the authentication state, so it is
+        calculated once and reset when the client authenticates.
+        """
+        if self._security_score is None:
+            self._security_score = self._calculate_security_score()
+        return self._security_score
     
-    async def _calculate_security_score(self) -> float:
+    def _calculate_security_score(self) -> float:
         """Calculate security score for the client"""
         score = 0.0
         
@@ -579,11 +759,28 @@ class SecureWebhookServer:
         self.app = None
         self.runner = None
         
+        # Response fields fixed by the configuration, built once; handlers
+        # add the timestamp and per-client context
+        self._health_security = {
+            "authentication_enabled": True,
+            "tls_enabled": self.security_config.tls_enabled,
+            "audit_enabled": self.security_config.audit_enabled
+        }
+        self._security_status_template = {
+            "security_enabled": True,
+            "authentication_active": True,
+            "tls_enabled": self.security_config.tls_enabled,
+            "audit_enabled": self.security_config.audit_enabled,
+            "rate_limiting_active": True,
+            "timestamp": None,
+            "client_context": None
+        }
+        
         logger.info(f"Secure webhook server initialized on {host}:{port}")
     
     async def start(self):
         """Start the secure webhook server"""
-        from aiohttp import web, web_runner
+        from aiohttp import web_runner
         
         app = web.Application(middlewares=[self._security_middleware])
         
@@ -651,11 +848,11 @@ class SecureWebhookServer:
             return response
             
         except SecurityError as e:
-            return web.json_response(
+            return _json_response(
                 {
                     "error": e.message,
                     "error_type": e.error_type,
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": _iso_ts(int(time.time()))
                 },
                 status=e.status_code
             )
@@ -664,15 +861,11 @@ class SecureWebhookServer:
         """Handle health check requests"""
         health_status = {
             "status": "healthy",
-            "timestamp": datetime.utcnow().isoformat(),
-            "security": {
-                "authentication_enabled": True,
-                "tls_enabled": self.security_config.tls_enabled,
-                "audit_enabled": self.security_config.audit_enabled
-            }
+            "timestamp": _iso_ts(int(time.time())),
+            "security": self._health_security
         }
         
-        return web.json_response(health_status)
+        return _json_response(health_status)
     
     async def _handle_backup_complete(self, request):
         """Handle secure backup completion webhooks"""
@@ -705,14 +898,14 @@ class SecureWebhookServer:
             "success": True,
             "message": "Backup completion processed securely",
             "backup_id": backup_data.get("backup_id"),
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _iso_ts(int(time.time())),
             "security_context": {
                 "authenticated": True,
                 "client_id": auth_context.client_id
             }
         }
         
-        return web.json_response(response_data)
+        return _json_response(response_data)
     
     async def _handle_security_status(self, request):
         """Handle security status requests"""
@@ -724,29 +917,81 @@ class SecureWebhookServer:
         # Authorize the request
         self.security_manager.authorize_request(auth_context, "security_status")
         
-        status = {
-            "security_enabled": True,
-            "authentication_active": True,
-            "tls_enabled": self.security_config.tls_enabled,
-            "audit_enabled": self.security_config.audit_enabled,
-            "rate_limiting_active": True,
-            "timestamp": datetime.utcnow().isoformat(),
-            "client_context": {
-                "client_id": auth_context.client_id,
-                "auth_method": auth_context.auth_method,
-                "permissions": auth_context.permissions
-            }
+        status = self._security_status_template.copy()
+        status["timestamp"] = _iso_ts(int(time.time()))
+        status["client_context"] = {
+            "client_id": auth_context.client_id,
+            "auth_method": auth_context.auth_method,
+            "permissions": auth_context.permissions
         }
         
-        return web.json_response(status)
+        return _json_response(status)
 
 
 # Convenience functions for secure operations
 
+# Application-wide clients, one per distinct config, so repeated backup events
+# and status checks reuse an authenticated client and its pooled TLS
+# connections. Clients stay open until close_shared_client(), as callers may
+# still be using them. They belong to the event loop they were entered on;
+# only there can their sessions be closed and queued audit events be written.
+_shared_clients: Dict[str, SecureGitOpsClient] = {}
+_shared_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_shared_client_lock: Optional[asyncio.Lock] = None
+
+
+def _config_key(config: Dict[str, Any]) -> str:
+    """Canonical form of a client config, for keying shared clients"""
+    return json.dumps(config, sort_keys=True, default=str)
+
+
+async def get_shared_client(config: Dict[str, Any]) -> SecureGitOpsClient:
+    """Return the shared, authenticated client for config, creating it if needed
+    
+    Raises:
+        RuntimeError: Shared clients are still open on another event loop;
+            close_shared_client() must be awaited there before it exits
+    """
+    global _shared_client_loop, _shared_client_lock
+    
+    loop = asyncio.get_running_loop()
+    if _shared_client_loop is not loop:
+        if any(not client.session.closed for client in _shared_clients.values()):
+            raise RuntimeError("Shared secure GitOps clients are open on another event loop; "
+                               "await close_shared_client() before that loop exits")
+        # The previous loop's clients are closed and its lock cannot be used here
+        _shared_clients.clear()
+        _shared_client_lock = asyncio.Lock()
+        _shared_client_loop = loop
+    
+    key = _config_key(config)
+    # Entering authenticates, so serialize creation across concurrent callers
+    async with _shared_client_lock:
+        client = _shared_clients.get(key)
+        if client is None or client.session.closed:
+            client = SecureGitOpsClient(config)
+            await client.__aenter__()
+            _shared_clients[key] = client
+        return client
+
+
+async def close_shared_client():
+    """Close the shared clients and flush their audit queues; await on their loop at shutdown"""
+    clients = list(_shared_clients.values())
+    _shared_clients.clear()
+    for client in clients:
+        await client.__aexit__(None, None, None)
+
+
 async def process_secure_backup_completion(config: Dict[str, Any], backup_event: Dict[str, Any], 
                                          monitoring_client=None) -> Dict[str, Any]:
     """Process backup completion securely and generate GitOps artifacts"""
-    async with SecureGitOpsClient(config, monitoring_client) as client:
+    client = await get_shared_client(config)
+    
+    # Report this call's metrics to the caller's monitoring client without
+    # changing the shared client
+    token = _call_monitoring.set(monitoring_client)
+    try:
         # Create secure GitOps request from backup event
         request = client.create_secure_request_from_backup(backup_event)
         
@@ -761,44 +1006,52 @@ async def process_secure_backup_completion(config: Dict[str, Any], backup_event:
         await client.notify_secure_completion(status)
         
         return status
+    finally:
+        _call_monitoring.reset(token)
+
+
+async def _fetch_bridge_status(client: SecureGitOpsClient) -> Dict[str, Any]:
+    """Get the bridge status, or an error entry if the bridge cannot be reached"""
+    try:
+        async with secure_http_request(
+            client.session, "GET",
+            client._url_bridge_status,
+            client.security_manager
+        ) as response:
+            if response.status == 200:
+                return _json_loads(await response.read())
+            return {"error": f"Bridge unreachable: {response.status}"}
+    except Exception as e:
+        return {"error": f"Bridge unreachable: {e}"}
 
 
 async def get_secure_integration_status(config: Dict[str, Any]) -> Dict[str, Any]:
     """Get overall secure integration status"""
-    async with SecureGitOpsClient(config) as client:
-        try:
-            gitops_health = await client.get_secure_health_status()
-            
-            # Try to get bridge status
-            try:
-                async with secure_http_request(
-                    client.session, "GET",
-                    urljoin(client.bridge_url, "/status"),
-                    client.security_manager
-                ) as response:
-                    if response.status == 200:
-                        bridge_status = await response.json()
-                    else:
-                        bridge_status = {"error": f"Bridge unreachable: {response.status}"}
-            except Exception as e:
-                bridge_status = {"error": f"Bridge unreachable: {e}"}
-            
-            return {
-                "gitops": gitops_health,
-                "bridge": bridge_status,
-                "security": {
-                    "authentication_enabled": True,
-                    "client_authenticated": client.auth_context.authenticated if client.auth_context else False,
-                    "security_score": await client._calculate_security_score()
-                },
-                "timestamp": datetime.utcnow().isoformat()
-            }
-            
-        except Exception as e:
-            return {
-                "error": str(e),
-                "timestamp": datetime.utcnow().isoformat()
-            }
+    client = await get_shared_client(config)
+    try:
+        # The generator and bridge are queried concurrently; bridge
+        # failures are reported in its entry rather than raised
+        gitops_health, bridge_status = await asyncio.gather(
+            client.get_secure_health_status(),
+            _fetch_bridge_status(client)
+        )
+        
+        return {
+            "gitops": gitops_health,
+            "bridge": bridge_status,
+            "security": {
+                "authentication_enabled": True,
+                "client_authenticated": client.auth_context.authenticated if client.auth_context else False,
+                "security_score": client._get_security_score()
+            },
+            "timestamp": _iso_ts(int(time.time()))
+        }
+        
+    except Exception as e:
+        return {
+            "error": str(e),
+            "timestamp": _iso_ts(int(time.time()))
+        }
 
 
 if __name__ == "__main__":
@@ -828,21 +1081,24 @@ if __name__ == "__main__":
             }
         }
         
-        # Test secure integration
-        status = await get_secure_integration_status(config)
-        print(json.dumps(status, indent=2))
-        
         # Test secure backup processing
         backup_event = {
             "backup_id": "test-backup-123",
             "cluster_name": "test-cluster",
             "minio_path": "test-cluster/2024/01/15/test-backup-123",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _iso_ts(int(time.time())),
             "resource_count": 10,
             "size": 1024000
         }
         
-        result = await process_secure_backup_completion(config, backup_event)
-        print(f"Secure processing result: {result}")
+        try:
+            # Test secure integration
+            status = await get_secure_integration_status(config)
+            print(json.dumps(status, indent=2))
+            
+            result = await process_secure_backup_completion(config, backup_event)
+            print(f"Secure processing result: {result}")
+        finally:
+            await close_shared_client()
     
     asyncio.run(main())
\ No newline at end of file
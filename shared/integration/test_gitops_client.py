@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Tests for GitOps client completion notifications
+"""
+
+import asyncio
+import unittest
+from datetime import datetime
+from pathlib import Path
+import sys
+
+from aiohttp import web
+
+# Add the current directory to Python path for importing
+current_dir = Path(__file__).parent
+sys.path.insert(0, str(current_dir))
+
+from gitops_client import GitOpsClient, GitOpsStatus
+
+
+class TestCompletionNotifications(unittest.IsolatedAsyncioTestCase):
+    """Test cases for batched completion notifications."""
+
+    async def asyncSetUp(self):
+        self.batches = []
+        self.singles = []
+        self.app = web.Application()
+        self.app.router.add_post('/webhooks/gitops/completed', self._handle_single)
+
+    async def _start(self):
+        self.runner = web.AppRunner(self.app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        return {'integration': {'communication': {'endpoints': {
+            'integration_bridge': f'http://127.0.0.1:{port}'
+        }}}}
+
+    async def asyncTearDown(self):
+        await self.runner.cleanup()
+
+    async def _handle_single(self, request):
+        self.singles.append((await request.json())['data']['request_id'])
+        return web.json_response({'success': True})
+
+    async def _notify_all(self, config, count):
+        async with GitOpsClient(config) as client:
+            return await asyncio.gather(*(
+                client.notify_completion(
+                    GitOpsStatus(request_id=str(i), status='completed', start_time=datetime.utcnow())
+                )
+                for i in range(count)
+            ))
+
+    async def test_batch_partial_failure(self):
+        """Test that each caller gets the result of its own batch entry."""
+        async def handle_batch(request):
+            entries = await request.json()
+            self.batches.append(len(entries))
+            results = [
+                {'id': e['id'], 'success': e['data']['request_id'] != '2'}
+                for e in entries
+            ]
+            return web.json_response({'success': False, 'data': {'results': results}})
+
+        self.app.router.add_post('/webhooks/gitops/completed_batch', handle_batch)
+        config = await self._start()
+
+        delivered = await self._notify_all(config, 4)
+
+        self.assertEqual(self.batches, [4])
+        self.assertEqual(delivered, [True, True, False, True])
+        self.assertEqual(self.singles, [])
+
+    async def test_batch_malformed_reply(self):
+        """Test that an unreadable batch reply marks every notification undelivered."""
+        replies = [
+            {'success': True, 'data': {'results': None}},
+            {'success': True, 'data': {'results': [1, 2, 3]}},
+            {'success': True, 'data': {'results': [{'success': True}]}},
+            {'success': True},
+        ]
+
+        async def handle_batch(request):
+            self.batches.append(len(await request.json()))
+            return web.json_response(replies[len(self.batches) - 1])
+
+        self.app.router.add_post('/webhooks/gitops/completed_batch', handle_batch)
+        config = await self._start()
+
+        for _ in replies:
+            delivered = await asyncio.wait_for(self._notify_all(config, 3), timeout=5)
+            self.assertEqual(delivered, [False, False, False])
+        self.assertEqual(self.singles, [])
+
+    async def test_fallback_without_batch_endpoint(self):
+        """Test that notifications are posted one by one when the bridge has no batch endpoint."""
+        config = await self._start()
+
+        delivered = await self._notify_all(config, 3)
+
+        self.assertEqual(delivered, [True, True, True])
+        self.assertEqual(sorted(self.singles), ['0', '1', '2'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -39,6 +39,13 @@ type WebhookResponse struct {
 	Data      interface{} `json:"data,omitempty"`
 }
 
+// BatchEntryResult reports the outcome of one notification in a batch
+type BatchEntryResult struct {
+	ID      string `json:"id"`
+	Success bool   `json:"success"`
+	Error   string `json:"error,omitempty"`
+}
+
 // NewWebhookHandler creates a new webhook handler
 func NewWebhookHandler(bridge *IntegrationBridge) *WebhookHandler {
 	mux := http.NewServeMux()
@@ -137,6 +144,7 @@ func (wh *WebhookHandler) registerRoutes() {
 	
 	// GitOps completion webhook
 	wh.mux.HandleFunc("/webhooks/gitops/completed", wh.handleGitOpsCompleted)
+	wh.mux.HandleFunc("/webhooks/gitops/completed_batch", wh.handleGitOpsCompletedBatch)
 	
 	// Component registration endpoints
 	wh.mux.HandleFunc("/register/backup", wh.handleRegisterBackup)
@@ -326,6 +334,80 @@ func (wh *WebhookHandler) handleGitOpsCompleted(w http.ResponseWriter, r *http.R
 	wh.sendJSONResponse(w, http.StatusOK, response)
 }
 
+// handleGitOpsCompletedBatch processes a JSON array of GitOps completion notifications.
+// Every entry is published; the response carries one result per entry, in request
+// order, so callers can tell which notifications were delivered.
+func (wh *WebhookHandler) handleGitOpsCompletedBatch(w http.ResponseWriter, r *http.Request) {
+	if r.Method != http.MethodPost {
+		http.Error(w, "Method not allowed", http.StatusMethodNotAllowed)
+		return
+	}
+
+	var requests []WebhookRequest
+	if err := wh.parseJSONRequest(r, &requests); err != nil {
+		wh.sendErrorResponse(w, http.StatusBadRequest, "Invalid JSON payload", err)
+		return
+	}
+
+	metrics := wh.bridge.monitoringSystem.GetMonitoringHub().GetMetricsCollector()
+	results := make([]BatchEntryResult, len(requests))
+	failed := 0
+	for i, request := range requests {
+		results[i].ID = request.ID
+
+		// Create integration event
+		integrationEvent := &IntegrationEvent{
+			ID:        request.ID,
+			Type:      "gitops_completed",
+			Source:    request.Source,
+			Target:    "integration-bridge",
+			Timestamp: time.Now(),
+			Data:      request.Data,
+			Metadata: map[string]interface{}{
+				"webhook_id": request.ID,
+			},
+		}
+
+		// Publish event; a failure is reported for this entry only
+		if err := wh.bridge.eventBus.Publish(r.Context(), integrationEvent); err != nil {
+			results[i].Error = err.Error()
+			failed++
+			metrics.IncCounter("webhook_requests_total",
+				map[string]string{"endpoint": "gitops_completed", "status": "error"}, 1)
+			continue
+		}
+		results[i].Success = true
+
+		// Update metrics
+		status := "success"
+		if request.Data["error"] != nil {
+			status = "failure"
+		}
+
+		metrics.IncCounter("webhook_requests_total",
+			map[string]string{"endpoint": "gitops_completed", "status": status}, 1)
+	}
+
+	message := "GitOps completions processed"
+	if failed > 0 {
+		message = fmt.Sprintf("%d of %d GitOps completions failed", failed, len(requests))
+	}
+
+	response := WebhookResponse{
+		Success:   failed == 0,
+		Message:   message,
+		RequestID: fmt.Sprintf("batch-%d", time.Now().UnixNano()),
+		Timestamp: time.Now(),
+		Data: map[string]interface{}{
+			"processed": len(requests) - failed,
+			"failed":    failed,
+			"results":   results,
+		},
+	}
+
+	wh.sendJSONResponse(w, http.StatusOK, response)
+}
+
 // handleRegisterBackup registers backup tool component
 func (wh *WebhookHandler) handleRegisterBackup(w http.ResponseWriter, r *http.Request) {
 	if r.Method != http.MethodPost {
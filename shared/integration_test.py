@@ -6,6 +6,13 @@ Integration test demonstrating the complete shared configuration system.
 import os
 import sys
 
+import yaml
+
+try:
+    from yaml import CSafeDumper as _SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper
+
 # Add the config directory to Python path
 config_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config')
 sys.path.insert(0, config_dir)
@@ -106,10 +113,9 @@ def main():
         }
         
         import tempfile
-        import yaml
         
         with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(invalid_config_data, f)
+            yaml.dump(invalid_config_data, f, Dumper=_SafeDumper)
             invalid_config_path = f.name
         
         try: